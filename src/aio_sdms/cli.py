@@ -10,9 +10,6 @@ from pathlib import Path
 
 from aio_sdms import __version__, config, logger
 from aio_sdms.utils.dependency_checker import check_dependencies_startup
-from aio_sdms.ui.cli.cli_interface import CLIInterface
-from aio_sdms.ui.gui.gui_interface import GUIInterface
-from aio_sdms.ui.web.web_interface import WebInterface
 
 
 def main():
@@ -93,19 +90,23 @@ Examples:
     logger.info(f"Starting AIO-SDMS v{__version__}")
     
     try:
-        # Launch appropriate interface
+        # Launch appropriate interface; each is imported only when selected,
+        # so e.g. the CLI never loads Tkinter or Flask
         if args.gui:
             logger.info("Launching GUI interface")
+            from aio_sdms.ui.gui.gui_interface import GUIInterface
             interface = GUIInterface(config, logger)
             interface.run()
             
         elif args.web:
             logger.info(f"Launching web interface on {args.host}:{args.port}")
+            from aio_sdms.ui.web.web_interface import WebInterface
             interface = WebInterface(config, logger)
             interface.run(host=args.host, port=args.port)
             
         else:  # CLI (default)
             logger.info("Launching CLI interface")
+            from aio_sdms.ui.cli.cli_interface import CLIInterface
             interface = CLIInterface(config, logger)
             interface.run(args.tool)
             
@@ -5,9 +5,10 @@ Extracted and refactored from BatteryMonitoringTool
 
 import psutil
 import time
-from typing import Dict, Any, Optional, NamedTuple, Callable
-from dataclasses import dataclass
-from aio_sdms.utils.utils import safe_execute, format_percentage, format_duration
+from enum import IntEnum
+from typing import Dict, Any, Optional, NamedTuple, Callable, List, Tuple, Union
+from dataclasses import dataclass, field
+from aio_sdms.utils.utils import safe_execute, format_percentage, format_duration, DATACLASS_SLOTS
 
 class BatteryInfo(NamedTuple):
     """Battery information data structure"""
@@ -16,7 +17,20 @@ class BatteryInfo(NamedTuple):
     time_left: Optional[int]  # seconds, None if unknown
     power_plugged: bool
 
-@dataclass
+class BatteryEvent(IntEnum):
+    """Battery events callbacks can be registered for"""
+    UPDATE = 0
+    LOW_BATTERY = 1
+    CHARGING_CHANGED = 2
+
+# String names accepted by register_callback/unregister_callback
+_EVENT_NAMES: Dict[str, BatteryEvent] = {
+    'update': BatteryEvent.UPDATE,
+    'low_battery': BatteryEvent.LOW_BATTERY,
+    'charging_changed': BatteryEvent.CHARGING_CHANGED
+}
+
+@dataclass(**DATACLASS_SLOTS)
 class BatteryConfig:
     """Battery monitoring configuration"""
     charger_wattage: float = 65.0  # Watts
@@ -24,6 +38,18 @@ class BatteryConfig:
     update_interval: int = 5  # seconds
     low_battery_threshold: int = 15  # percentage
     alert_on_low_battery: bool = True
+    max_update_interval: int = 60  # seconds, backoff cap while state is stable
+    cache_ttl: float = 3.0  # seconds to reuse the last psutil reading
+    # Derived from charger_wattage and battery_capacity in __post_init__
+    charging_rate_pct_per_hour: float = field(init=False, default=0.0)
+    minutes_per_percent: Optional[float] = field(init=False, default=None)
+    
+    def __post_init__(self):
+        try:
+            self.charging_rate_pct_per_hour = (self.charger_wattage * 1000.0) / self.battery_capacity
+            self.minutes_per_percent = 60.0 / self.charging_rate_pct_per_hour
+        except ZeroDivisionError:
+            self.minutes_per_percent = None
 
 class BatteryMonitor:
     """Core battery monitoring functionality"""
@@ -31,14 +57,24 @@ class BatteryMonitor:
     def __init__(self, config: Optional[BatteryConfig] = None):
         self.config = config or BatteryConfig()
         self._last_info: Optional[BatteryInfo] = None
-        self._callbacks: Dict[str, list] = {
-            'update': [],
-            'low_battery': [],
-            'charging_changed': []
-        }
+        # Callback lists indexed by BatteryEvent
+        self._callbacks: Tuple[List[Callable], ...] = tuple([] for _ in BatteryEvent)
+        self._any_callback = False
+        # Last psutil reading, reused until cache_ttl expires
+        self._cache_ts: float = 0.0
+        self._cache_info: Optional[BatteryInfo] = None
+    
+    def refresh(self):
+        """Invalidate the cached reading so the next query hits psutil"""
+        self._cache_ts = 0.0
+        self._cache_info = None
     
     def get_battery_info(self) -> Optional[BatteryInfo]:
-        """Get current battery information"""
+        """Get current battery information (cached for config.cache_ttl seconds)"""
+        now = time.monotonic()
+        if self._cache_ts and now - self._cache_ts < self.config.cache_ttl:
+            return self._cache_info
+        
         def _get_info():
             battery = psutil.sensors_battery()
             if battery is None:
@@ -54,10 +90,12 @@ class BatteryMonitor:
         info = safe_execute(_get_info)
         
         # Trigger callbacks if info changed
-        if info and self._last_info:
+        if self._any_callback and info and self._last_info:
             self._check_callbacks(self._last_info, info)
         
         self._last_info = info
+        self._cache_info = info
+        self._cache_ts = now
         return info
     
     def calculate_charging_time(self, current_percentage: float) -> Optional[float]:
@@ -65,18 +103,11 @@ class BatteryMonitor:
         if current_percentage >= 100:
             return 0.0
         
-        try:
-            # Calculate charging rate (% per hour)
-            charging_rate = (self.config.charger_wattage * 1000) / self.config.battery_capacity
-            
-            # Calculate remaining percentage and time
-            remaining_percentage = 100 - current_percentage
-            time_hours = remaining_percentage / charging_rate
-            
-            return time_hours * 60  # Convert to minutes
-            
-        except (ZeroDivisionError, ValueError):
+        minutes_per_percent = self.config.minutes_per_percent
+        if minutes_per_percent is None:
             return None
+        
+        return (100 - current_percentage) * minutes_per_percent
     
     def calculate_discharge_time(self, current_percentage: float) -> Optional[float]:
         """Estimate battery discharge time (simplified calculation)"""
@@ -110,8 +141,7 @@ class BatteryMonitor:
                 result["estimated_charging_time"] = charging_time
                 result["estimated_charging_time_formatted"] = format_duration(charging_time * 60)
                 
-                # Calculate charging rate
-                charging_rate = (self.config.charger_wattage * 1000) / self.config.battery_capacity
+                charging_rate = self.config.charging_rate_pct_per_hour
                 result["charging_rate"] = charging_rate
                 result["charging_rate_formatted"] = f"{charging_rate:.2f}% per hour"
         else:
@@ -129,48 +159,97 @@ class BatteryMonitor:
     
     def is_battery_available(self) -> bool:
         """Check if battery is available on this system"""
-        return safe_execute(lambda: psutil.sensors_battery() is not None, default_return=False)
+        return self.get_battery_info() is not None
     
-    def register_callback(self, event: str, callback: Callable):
+    def _resolve_event(self, event: Union[BatteryEvent, str]) -> Optional[BatteryEvent]:
+        """Map an event name or BatteryEvent to a BatteryEvent"""
+        if isinstance(event, BatteryEvent):
+            return event
+        return _EVENT_NAMES.get(event)
+    
+    def register_callback(self, event: Union[BatteryEvent, str], callback: Callable):
         """Register callback for battery events"""
-        if event in self._callbacks:
-            self._callbacks[event].append(callback)
+        resolved = self._resolve_event(event)
+        if resolved is not None:
+            self._callbacks[resolved].append(callback)
+            self._any_callback = True
     
-    def unregister_callback(self, event: str, callback: Callable):
+    def unregister_callback(self, event: Union[BatteryEvent, str], callback: Callable):
         """Unregister callback for battery events"""
-        if event in self._callbacks and callback in self._callbacks[event]:
-            self._callbacks[event].remove(callback)
+        resolved = self._resolve_event(event)
+        if resolved is not None and callback in self._callbacks[resolved]:
+            self._callbacks[resolved].remove(callback)
+            self._any_callback = any(self._callbacks)
     
     def _check_callbacks(self, old_info: BatteryInfo, new_info: BatteryInfo):
         """Check and trigger appropriate callbacks"""
+        update_callbacks, low_battery_callbacks, charging_callbacks = self._callbacks
+        
         # Low battery alert
         if (new_info.percentage <= self.config.low_battery_threshold and 
             not new_info.is_charging and 
             self.config.alert_on_low_battery):
-            for callback in self._callbacks['low_battery']:
-                safe_execute(lambda: callback(new_info))
+            for callback in low_battery_callbacks:
+                try:
+                    callback(new_info)
+                except Exception:
+                    pass
         
         # Charging status changed
         if old_info.is_charging != new_info.is_charging:
-            for callback in self._callbacks['charging_changed']:
-                safe_execute(lambda: callback(old_info, new_info))
+            for callback in charging_callbacks:
+                try:
+                    callback(old_info, new_info)
+                except Exception:
+                    pass
         
         # General update
-        for callback in self._callbacks['update']:
-            safe_execute(lambda: callback(new_info))
+        for callback in update_callbacks:
+            try:
+                callback(new_info)
+            except Exception:
+                pass
     
-    def start_monitoring(self, callback: Callable, interval: Optional[int] = None):
+    def start_monitoring(self, callback: Callable, interval: Optional[int] = None,
+                         wait: Optional[Callable[[float], bool]] = None):
         """Start continuous monitoring (blocking)"""
-        monitor_interval = interval or self.config.update_interval
+        # `wait(seconds)` replaces the sleep between updates; returning True stops monitoring
+        base_interval = interval or self.config.update_interval
+        max_interval = max(base_interval, self.config.max_update_interval)
+        monitor_interval = base_interval
+        previous: Optional[BatteryInfo] = None
         
         try:
+            deadline = time.monotonic() + monitor_interval
             while True:
+                # Every tick takes a new reading; the cache only lets
+                # get_detailed_info() below reuse it
+                self.refresh()
                 info = self.get_battery_info()
                 if info:
                     detailed_info = self.get_detailed_info()
-                    safe_execute(lambda: callback(detailed_info))
+                    try:
+                        callback(detailed_info)
+                    except Exception:
+                        pass
                 
-                time.sleep(monitor_interval)
+                # Back off while percentage and charging state are unchanged
+                if (info and previous and
+                        info.percentage == previous.percentage and
+                        info.is_charging == previous.is_charging):
+                    monitor_interval = min(monitor_interval * 2, max_interval)
+                else:
+                    monitor_interval = base_interval
+                previous = info
+                
+                remaining = max(0.0, deadline - time.monotonic())
+                if wait is None:
+                    time.sleep(remaining)
+                elif wait(remaining):
+                    break
+                # Schedule against the previous deadline to avoid drift,
+                # re-anchoring if the work overran it
+                deadline = max(deadline + monitor_interval, time.monotonic())
                 
         except KeyboardInterrupt:
             pass
@@ -180,16 +259,15 @@ class BatteryMonitor:
         result: Dict[str, Any] = {"health_available": False}
         
         # On Windows, we might be able to get more detailed info
-        if hasattr(psutil, 'sensors_battery'):
-            info = self.get_battery_info()
-            if info:
-                result.update({
-                    "health_available": True,
-                    "current_percentage": info.percentage,
-                    "charging_cycles": "Unknown",  # Not available via psutil
-                    "design_capacity": "Unknown",  # Not available via psutil
-                    "current_capacity": "Unknown"  # Not available via psutil
-                })
+        info = self.get_battery_info()
+        if info:
+            result.update({
+                "health_available": True,
+                "current_percentage": info.percentage,
+                "charging_cycles": "Unknown",  # Not available via psutil
+                "design_capacity": "Unknown",  # Not available via psutil
+                "current_capacity": "Unknown"  # Not available via psutil
+            })
         
         return result
 
@@ -6,7 +6,8 @@ Extracted and refactored from DeviceDiagnosticTool
 import asyncio
 import subprocess
 import platform
-from typing import Dict, Any, List, Optional, NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, NamedTuple, Iterator, Callable
 from dataclasses import dataclass
 from enum import Enum
 from aio_sdms.utils.utils import safe_execute, is_windows, is_linux, is_macos
@@ -42,11 +43,9 @@ class HardwareDiagnostics:
         self.config = config or DiagnosticConfig()
         self.results: List[DiagnosticResult] = []
     
-    def run_all_tests(self) -> List[DiagnosticResult]:
-        """Run all available diagnostic tests"""
-        self.results.clear()
-        
-        tests = [
+    def _all_tests(self) -> List[Callable[[], DiagnosticResult]]:
+        """All available test methods, in display order"""
+        return [
             self._test_bluetooth,
             self._test_wifi,
             self._test_camera,
@@ -55,6 +54,12 @@ class HardwareDiagnostics:
             self._test_keyboard,
             self._test_mouse
         ]
+    
+    def run_all_tests(self) -> List[DiagnosticResult]:
+        """Run all available diagnostic tests"""
+        self.results.clear()
+        
+        tests = self._all_tests()
         
         for test in tests:
             try:
@@ -73,6 +78,43 @@ class HardwareDiagnostics:
         
         return self.results
     
+    def iter_all_tests(self, max_workers: Optional[int] = None) -> Iterator[DiagnosticResult]:
+        """Run all diagnostic tests concurrently, yielding each result as it finishes"""
+        self.results.clear()
+        
+        tests = self._all_tests()
+        
+        # The microphone would record the speaker's tone and both open the audio
+        # device, so those two run back to back as one task
+        audio_tests = [test for test in tests if test in (self._test_microphone, self._test_speaker)]
+        groups = [[test] for test in tests if test not in audio_tests] + [audio_tests]
+        
+        # The other probes mostly wait on drivers and subprocesses, so they overlap well
+        with ThreadPoolExecutor(max_workers=max_workers or len(groups)) as pool:
+            futures = [pool.submit(self._run_tests_in_order, group) for group in groups]
+            for future in as_completed(futures):
+                for result in future.result():
+                    if result:
+                        self.results.append(result)
+                        yield result
+    
+    def _run_tests_in_order(self, tests: List[Callable[[], DiagnosticResult]]) -> List[Optional[DiagnosticResult]]:
+        """Run tests one after another, turning an escaped exception into an ERROR result"""
+        results = []
+        for test in tests:
+            try:
+                result = safe_execute(test, default_return=None)
+            except Exception as e:
+                result = DiagnosticResult(
+                    test_name=test.__name__.replace('_test_', ''),
+                    status=TestResult.ERROR,
+                    message=f"Test execution failed: {str(e)}",
+                    details={},
+                    duration=0.0
+                )
+            results.append(result)
+        return results
+    
     def run_single_test(self, test_name: str) -> Optional[DiagnosticResult]:
         """Run a single diagnostic test"""
         test_methods = {
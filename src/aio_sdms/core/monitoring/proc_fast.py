@@ -0,0 +1,146 @@
+"""
+Fast /proc Readers (Linux)
+Keeps the high-frequency /proc files open and re-reads them with pread
+"""
+
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+
+class VirtualMemory(NamedTuple):
+    """Subset of psutil.virtual_memory() fields"""
+    total: int
+    available: int
+    used: int
+    free: int
+    percent: float
+
+class SwapMemory(NamedTuple):
+    """Subset of psutil.swap_memory() fields"""
+    total: int
+    used: int
+    free: int
+    percent: float
+
+class NetIOCounters(NamedTuple):
+    """Subset of psutil.net_io_counters() fields"""
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+
+_READ_SIZE = 65536
+
+class ProcReader:
+    """Persistent-descriptor reader for /proc/stat, /proc/meminfo and /proc/net/dev"""
+
+    def __init__(self, proc_root: str = "/proc"):
+        self._fds: Dict[str, int] = {}
+        try:
+            for name in ("stat", "meminfo", "net/dev"):
+                self._fds[name] = os.open(os.path.join(proc_root, name), os.O_RDONLY)
+        except OSError:
+            self.close()
+            raise
+        self._last_cpu_times: Optional[Tuple[int, int]] = None
+        self.cpu_percent()  # Prime the baseline
+
+    def close(self) -> None:
+        """Close all held descriptors"""
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+
+    def _read(self, name: str) -> bytes:
+        """Re-read a whole /proc file from offset 0"""
+        fd = self._fds[name]
+        data = os.pread(fd, _READ_SIZE, 0)
+        if len(data) < _READ_SIZE:
+            return data
+        chunks = [data]
+        offset = len(data)
+        while True:
+            chunk = os.pread(fd, _READ_SIZE, offset)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+            offset += len(chunk)
+
+    def cpu_percent(self) -> float:
+        """Total CPU usage since the previous call, like psutil.cpu_percent(None)"""
+        data = self._read("stat")
+        # "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+        fields = data[:data.index(b"\n")].split()[1:9]
+        times = [int(value) for value in fields]
+        total = sum(times)
+        idle = times[3] + times[4]
+
+        last = self._last_cpu_times
+        self._last_cpu_times = (total, idle)
+        if last is None:
+            return 0.0
+
+        total_delta = total - last[0]
+        if total_delta <= 0:
+            return 0.0
+        busy_delta = total_delta - (idle - last[1])
+        return round(max(0.0, min(100.0, busy_delta * 100.0 / total_delta)), 1)
+
+    def _meminfo(self) -> Dict[bytes, int]:
+        """Parse /proc/meminfo into bytes values keyed by field name"""
+        values = {}
+        for line in self._read("meminfo").splitlines():
+            key, _, rest = line.partition(b":")
+            parts = rest.split()
+            if parts:
+                value = int(parts[0])
+                values[key] = value * 1024 if len(parts) > 1 else value
+        return values
+
+    def memory(self) -> Tuple[VirtualMemory, SwapMemory]:
+        """Virtual and swap memory from a single /proc/meminfo read"""
+        info = self._meminfo()
+        total = info.get(b"MemTotal", 0)
+        free = info.get(b"MemFree", 0)
+        cached = info.get(b"Cached", 0) + info.get(b"SReclaimable", 0)
+        available = info.get(b"MemAvailable", free + info.get(b"Buffers", 0) + cached)
+        used = total - available
+        virtual = VirtualMemory(
+            total=total,
+            available=available,
+            used=used,
+            free=free,
+            percent=round((total - available) * 100.0 / total, 1) if total else 0.0
+        )
+
+        swap_total = info.get(b"SwapTotal", 0)
+        swap_free = info.get(b"SwapFree", 0)
+        swap_used = swap_total - swap_free
+        swap = SwapMemory(
+            total=swap_total,
+            used=swap_used,
+            free=swap_free,
+            percent=round(swap_used * 100.0 / swap_total, 1) if swap_total else 0.0
+        )
+        return virtual, swap
+
+    def virtual_memory(self) -> VirtualMemory:
+        """Equivalent of psutil.virtual_memory() for the fields the monitor uses"""
+        return self.memory()[0]
+
+    def net_io_counters(self) -> NetIOCounters:
+        """Equivalent of psutil.net_io_counters() summed over all interfaces"""
+        bytes_recv = packets_recv = bytes_sent = packets_sent = 0
+        # Skip the two header lines
+        for line in self._read("net/dev").splitlines()[2:]:
+            _, _, counters = line.partition(b":")
+            fields = counters.split()
+            if len(fields) < 10:
+                continue
+            bytes_recv += int(fields[0])
+            packets_recv += int(fields[1])
+            bytes_sent += int(fields[8])
+            packets_sent += int(fields[9])
+        return NetIOCounters(bytes_sent, bytes_recv, packets_sent, packets_recv)
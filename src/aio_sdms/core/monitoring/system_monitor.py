@@ -3,12 +3,22 @@ System Monitoring Core Module
 Extracted and refactored from SystemMonitorTool
 """
 
+import os
+import re
+import glob
 import subprocess
 import platform
+import time
+import heapq
+import functools
 import psutil
-from typing import Dict, Any, List, Optional, NamedTuple
+from array import array
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple
 from dataclasses import dataclass
-from aio_sdms.utils.utils import safe_execute, format_bytes, format_percentage, is_windows, is_linux
+from aio_sdms.utils.utils import (
+    safe_execute, format_bytes, format_percentage, IS_WINDOWS, IS_LINUX, DATACLASS_SLOTS
+)
+from aio_sdms.core.monitoring.proc_fast import ProcReader
 
 class SystemMetrics(NamedTuple):
     """System metrics data structure"""
@@ -22,7 +32,38 @@ class SystemMetrics(NamedTuple):
     network_sent: int
     network_recv: int
 
-@dataclass
+# hwmon sysfs attributes read directly for temperatures and fan speeds
+_HWMON_INPUTS = (
+    ("temperature", "/sys/class/hwmon/hwmon*/temp*_input"),
+    ("fan", "/sys/class/hwmon/hwmon*/fan*_input"),
+)
+
+# Line patterns for plain `sensors` output, e.g. "Core 0:  +45.0°C  (high = ...)"
+_SENSORS_TEMP_RE = re.compile(r'^\s*(?P<name>[^:]*(?:Core|temp)[^:]*):\s*(?P<value>[+-]?\d+(?:\.\d+)?)\s*°C')
+_SENSORS_FAN_RE = re.compile(r'^\s*(?P<name>[^:]*fan[^:]*):\s*(?P<value>\d+(?:\.\d+)?)\s*RPM', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=None)
+def _static_system_info() -> Tuple[Tuple[str, Any], ...]:
+    """Platform facts that cannot change while the process runs"""
+    return (
+        ("platform", platform.system()),
+        ("platform_version", platform.version()),
+        ("architecture", platform.architecture()[0]),
+        ("processor", platform.processor()),
+        ("hostname", platform.node()),
+        ("boot_time", psutil.boot_time())
+    )
+
+# Seconds to reuse the mounted partition list; mounts change rarely
+_PARTITION_CACHE_TTL = 30.0
+
+# Shortest interval a CPU usage sample is measured over, in seconds
+_CPU_MIN_WINDOW = 0.1
+
+# array typecodes for the column-per-field metrics history
+_HISTORY_TYPECODES = ('d', 'd', 'Q', 'Q', 'd', 'Q', 'Q', 'Q', 'Q')
+
+@dataclass(**DATACLASS_SLOTS)
 class MonitoringConfig:
     """System monitoring configuration"""
     update_interval: int = 2
@@ -31,101 +72,258 @@ class MonitoringConfig:
     include_disk_io: bool = True
     include_network: bool = True
     temperature_monitoring: bool = True
+    include_formatted: bool = False  # add human readable "*_formatted" keys
+    fast_proc: bool = False  # Linux: read /proc via persistent descriptors
+
+# Fields formatted by _format_dict when human readable output is requested
+_BYTE_KEYS = ("total", "available", "used", "free", "read_bytes", "write_bytes")
+
+def _format_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Add "*_formatted" string keys for the byte and percent fields of a dict"""
+    for key in _BYTE_KEYS:
+        if key in data:
+            data[f"{key}_formatted"] = format_bytes(data[key])
+    if "percent" in data:
+        data["percent_formatted"] = format_percentage(data["percent"])
+    return data
+
+@dataclass
+class _Snapshot:
+    """One read of the counters shared by the summary and metrics paths"""
+    timestamp: float
+    cpu_percent: float
+    virtual_memory: Any
+    swap_memory: Any
+    disk_usage: Any
+    net_io: Any
+
+class DiskInfo(dict):
+    """Disk figures dict that builds "*_formatted" keys on first access"""
+    
+    def __missing__(self, key):
+        if isinstance(key, str) and key.endswith("_formatted"):
+            field = key[:-len("_formatted")]
+            if field in self and (field in _BYTE_KEYS or field == "percent"):
+                value = format_percentage(self[field]) if field == "percent" else format_bytes(self[field])
+                self[key] = value
+                return value
+        raise KeyError(key)
+    
+    def pretty(self) -> Dict[str, Any]:
+        """Get a plain dict copy with every formatted key filled in"""
+        return _format_dict(dict(self))
 
 class SystemMonitor:
     """Core system monitoring functionality"""
     
     def __init__(self, config: Optional[MonitoringConfig] = None):
         self.config = config or MonitoringConfig()
-        self._metrics_history: List[SystemMetrics] = []
+        # Metrics history as a ring buffer of one typed array per field
+        self._history_size = max(1, self.config.history_length)
+        self._history_columns = tuple(
+            array(code, [0]) * self._history_size for code in _HISTORY_TYPECODES
+        )
+        self._history_head = 0
+        self._history_count = 0
+        # (counters, time.monotonic() timestamp) from the previous call
         self._network_counters_last = None
+        self._network_speed_last: Optional[Tuple[float, float]] = None
+        self._snapshot_cache: Optional[_Snapshot] = None
+        # Process objects kept across calls so cpu_percent() has a baseline
+        self._process_cache: Dict[int, psutil.Process] = {}
+        # Non-blocking cpu_percent() samples shared by all callers within
+        # one update_interval; primed here so the first real call diffs
+        self._cpu_sample: Optional[Tuple[float, Optional[List[float]]]] = None
+        self._cpu_info_cache: Optional[Dict[str, Any]] = None
+        self._cpu_info_time = 0.0
+        # Persistent /proc reader, replaces psutil for CPU/memory/network
+        self._proc: Optional[ProcReader] = None
+        if self.config.fast_proc and IS_LINUX:
+            try:
+                self._proc = ProcReader()
+            except OSError:
+                self._proc = None
+        psutil.cpu_percent(interval=None)
+        if self.config.include_per_cpu:
+            psutil.cpu_percent(interval=None, percpu=True)
+        # Time of the last cpu_percent() read, which the next sample diffs against
+        self._cpu_sample_time = time.monotonic()
+        # psutil.disk_partitions() and per-mountpoint disk_usage() results
+        self._partitions: Optional[list] = None
+        self._partitions_time = 0.0
+        self._disk_usage_cache: Dict[str, tuple] = {}
+        # (kind, name, fd) per hwmon input, discovered on first use
+        self._hwmon_sensors: Optional[List[tuple]] = None
+    
+    def __del__(self):
+        if getattr(self, '_hwmon_sensors', None) or getattr(self, '_proc', None):
+            self.close()
+    
+    def close(self) -> None:
+        """Release file descriptors held open for sensor and /proc reads"""
+        for _, _, fd in self._hwmon_sensors or ():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._hwmon_sensors = None
+        if self._proc:
+            self._proc.close()
+            self._proc = None
+    
+    def _snapshot(self) -> _Snapshot:
+        """Read CPU, memory, root disk and network counters once"""
+        # Reused for half an update_interval so get_system_summary and
+        # get_current_metrics share one read
+        now = time.monotonic()
+        cached = self._snapshot_cache
+        if cached is not None and now - cached.timestamp < self.config.update_interval / 2:
+            return cached
+        
+        if self._proc:
+            virtual_mem, swap_mem = self._proc.memory()
+            net_io = self._proc.net_io_counters()
+        else:
+            virtual_mem = psutil.virtual_memory()
+            swap_mem = psutil.swap_memory()
+            net_io = psutil.net_io_counters()
+        
+        snapshot = _Snapshot(
+            timestamp=now,
+            cpu_percent=self._sample_cpu_percent()[0],
+            virtual_memory=virtual_mem,
+            swap_memory=swap_mem,
+            disk_usage=self._get_disk_usage('/'),
+            net_io=net_io
+        )
+        self._snapshot_cache = snapshot
+        return snapshot
+    
+    def _sample_cpu_percent(self) -> Tuple[float, Optional[List[float]]]:
+        """Get total and per-CPU usage since the previous sample (non-blocking)"""
+        now = time.monotonic()
+        if self._cpu_sample is None or now - self._cpu_sample_time >= self.config.update_interval:
+            # A diff over a few milliseconds reads as 0%, so a monitor sampled right
+            # after construction waits until the baseline is _CPU_MIN_WINDOW old
+            elapsed = now - self._cpu_sample_time
+            if elapsed < _CPU_MIN_WINDOW:
+                time.sleep(_CPU_MIN_WINDOW - elapsed)
+                now = time.monotonic()
+            per_cpu = psutil.cpu_percent(interval=None, percpu=True) if self.config.include_per_cpu else None
+            usage = self._proc.cpu_percent() if self._proc else psutil.cpu_percent(interval=None)
+            self._cpu_sample = (usage, per_cpu)
+            self._cpu_sample_time = now
+        return self._cpu_sample
     
     def get_cpu_info(self) -> Dict[str, Any]:
         """Get CPU information and usage"""
+        now = time.monotonic()
+        if self._cpu_info_cache is not None and now - self._cpu_info_time < self.config.update_interval:
+            return self._cpu_info_cache
+        
         try:
+            usage_percent, per_cpu_percent = self._sample_cpu_percent()
+            frequency = psutil.cpu_freq()
             cpu_info = {
-                "usage_percent": psutil.cpu_percent(interval=1),
+                "usage_percent": usage_percent,
                 "count_logical": psutil.cpu_count(),
                 "count_physical": psutil.cpu_count(logical=False),
-                "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
+                "frequency": frequency._asdict() if frequency else None,
                 "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
             }
             
-            if self.config.include_per_cpu:
-                cpu_info["per_cpu_percent"] = psutil.cpu_percent(percpu=True)
+            if per_cpu_percent is not None:
+                cpu_info["per_cpu_percent"] = per_cpu_percent
             
+            self._cpu_info_cache = cpu_info
+            self._cpu_info_time = now
             return cpu_info
             
         except Exception as e:
             return {"error": f"Failed to get CPU info: {str(e)}"}
     
-    def get_memory_info(self) -> Dict[str, Any]:
+    def get_memory_info(self, snapshot: Optional[_Snapshot] = None) -> Dict[str, Any]:
         """Get memory information"""
         try:
-            virtual_mem = psutil.virtual_memory()
-            swap_mem = psutil.swap_memory()
+            snapshot = snapshot or self._snapshot()
+            virtual_mem = snapshot.virtual_memory
+            swap_mem = snapshot.swap_memory
             
-            return {
+            result = {
                 "virtual": {
                     "total": virtual_mem.total,
                     "available": virtual_mem.available,
                     "used": virtual_mem.used,
                     "free": virtual_mem.free,
-                    "percent": virtual_mem.percent,
-                    "total_formatted": format_bytes(virtual_mem.total),
-                    "available_formatted": format_bytes(virtual_mem.available),
-                    "used_formatted": format_bytes(virtual_mem.used),
-                    "percent_formatted": format_percentage(virtual_mem.percent)
+                    "percent": virtual_mem.percent
                 },
                 "swap": {
                     "total": swap_mem.total,
                     "used": swap_mem.used,
                     "free": swap_mem.free,
-                    "percent": swap_mem.percent,
-                    "total_formatted": format_bytes(swap_mem.total),
-                    "used_formatted": format_bytes(swap_mem.used),
-                    "percent_formatted": format_percentage(swap_mem.percent)
+                    "percent": swap_mem.percent
                 }
             }
             
+            if self.config.include_formatted:
+                _format_dict(result["virtual"])
+                _format_dict(result["swap"])
+            
+            return result
+            
         except Exception as e:
             return {"error": f"Failed to get memory info: {str(e)}"}
     
-    def get_disk_info(self) -> Dict[str, Any]:
+    def _get_partitions(self) -> list:
+        """Get mounted partitions, re-scanned every _PARTITION_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._partitions is None or now - self._partitions_time >= _PARTITION_CACHE_TTL:
+            self._partitions = psutil.disk_partitions()
+            self._partitions_time = now
+        return self._partitions
+    
+    def _get_disk_usage(self, mountpoint: str):
+        """Get disk usage for a mountpoint, reused for one update_interval"""
+        now = time.monotonic()
+        cached = self._disk_usage_cache.get(mountpoint)
+        if cached is not None and now - cached[0] < self.config.update_interval:
+            return cached[1]
+        usage = psutil.disk_usage(mountpoint)
+        self._disk_usage_cache[mountpoint] = (now, usage)
+        return usage
+    
+    def get_disk_info(self, snapshot: Optional[_Snapshot] = None) -> Dict[str, Any]:
         """Get disk information"""
         try:
-            disk_usage = psutil.disk_usage('/')
+            disk_usage = (snapshot or self._snapshot()).disk_usage
+            include_formatted = self.config.include_formatted
             
             result = {
-                "usage": {
-                    "total": disk_usage.total,
-                    "used": disk_usage.used,
-                    "free": disk_usage.free,
-                    "percent": (disk_usage.used / disk_usage.total) * 100,
-                    "total_formatted": format_bytes(disk_usage.total),
-                    "used_formatted": format_bytes(disk_usage.used),
-                    "free_formatted": format_bytes(disk_usage.free),
-                    "percent_formatted": format_percentage((disk_usage.used / disk_usage.total) * 100)
-                },
+                "usage": DiskInfo(
+                    total=disk_usage.total,
+                    used=disk_usage.used,
+                    free=disk_usage.free,
+                    percent=(disk_usage.used / disk_usage.total) * 100
+                ),
                 "partitions": []
             }
+            if include_formatted:
+                _format_dict(result["usage"])
             
             # Get all disk partitions
-            for partition in psutil.disk_partitions():
+            for partition in self._get_partitions():
                 try:
-                    partition_usage = psutil.disk_usage(partition.mountpoint)
-                    result["partitions"].append({
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "fstype": partition.fstype,
-                        "total": partition_usage.total,
-                        "used": partition_usage.used,
-                        "free": partition_usage.free,
-                        "percent": (partition_usage.used / partition_usage.total) * 100 if partition_usage.total > 0 else 0,
-                        "total_formatted": format_bytes(partition_usage.total),
-                        "used_formatted": format_bytes(partition_usage.used),
-                        "free_formatted": format_bytes(partition_usage.free)
-                    })
+                    partition_usage = self._get_disk_usage(partition.mountpoint)
+                    # Raw figures only; formatted keys are built on access
+                    result["partitions"].append(DiskInfo(
+                        device=partition.device,
+                        mountpoint=partition.mountpoint,
+                        fstype=partition.fstype,
+                        total=partition_usage.total,
+                        used=partition_usage.used,
+                        free=partition_usage.free,
+                        percent=(partition_usage.used / partition_usage.total) * 100 if partition_usage.total > 0 else 0
+                    ))
                 except (PermissionError, OSError):
                     # Skip inaccessible partitions
                     continue
@@ -133,27 +331,28 @@ class SystemMonitor:
             if self.config.include_disk_io:
                 disk_io = psutil.disk_io_counters()
                 if disk_io:
-                    result["io"] = {
-                        "read_count": disk_io.read_count,
-                        "write_count": disk_io.write_count,
-                        "read_bytes": disk_io.read_bytes,
-                        "write_bytes": disk_io.write_bytes,
-                        "read_bytes_formatted": format_bytes(disk_io.read_bytes),
-                        "write_bytes_formatted": format_bytes(disk_io.write_bytes)
-                    }
+                    result["io"] = DiskInfo(
+                        read_count=disk_io.read_count,
+                        write_count=disk_io.write_count,
+                        read_bytes=disk_io.read_bytes,
+                        write_bytes=disk_io.write_bytes
+                    )
+                    if include_formatted:
+                        _format_dict(result["io"])
             
             return result
             
         except Exception as e:
             return {"error": f"Failed to get disk info: {str(e)}"}
     
-    def get_network_info(self) -> Dict[str, Any]:
+    def get_network_info(self, snapshot: Optional[_Snapshot] = None) -> Dict[str, Any]:
         """Get network information"""
         try:
             if not self.config.include_network:
                 return {"disabled": True}
             
-            network_io = psutil.net_io_counters()
+            snapshot = snapshot or self._snapshot()
+            network_io = snapshot.net_io
             network_interfaces = psutil.net_if_addrs()
             network_stats = psutil.net_if_stats()
             
@@ -169,18 +368,26 @@ class SystemMonitor:
                 "interfaces": {}
             }
             
-            # Calculate network speed if we have previous counters
+            # Calculate network speed over the real interval between snapshots;
+            # a repeat call on the same snapshot reuses the last speed
+            now = snapshot.timestamp
             if self._network_counters_last:
-                time_diff = 1  # Assume 1 second interval
-                sent_diff = network_io.bytes_sent - self._network_counters_last.bytes_sent
-                recv_diff = network_io.bytes_recv - self._network_counters_last.bytes_recv
+                last_io, last_time = self._network_counters_last
+                time_diff = now - last_time
+                if time_diff > 0:
+                    self._network_speed_last = (
+                        (network_io.bytes_sent - last_io.bytes_sent) / time_diff,
+                        (network_io.bytes_recv - last_io.bytes_recv) / time_diff
+                    )
                 
-                result["io"]["send_speed"] = sent_diff / time_diff
-                result["io"]["recv_speed"] = recv_diff / time_diff
-                result["io"]["send_speed_formatted"] = f"{format_bytes(sent_diff)}/s"
-                result["io"]["recv_speed_formatted"] = f"{format_bytes(recv_diff)}/s"
+                if self._network_speed_last:
+                    send_speed, recv_speed = self._network_speed_last
+                    result["io"]["send_speed"] = send_speed
+                    result["io"]["recv_speed"] = recv_speed
+                    result["io"]["send_speed_formatted"] = f"{format_bytes(int(send_speed))}/s"
+                    result["io"]["recv_speed_formatted"] = f"{format_bytes(int(recv_speed))}/s"
             
-            self._network_counters_last = network_io
+            self._network_counters_last = (network_io, now)
             
             # Get interface details
             for interface_name, addresses in network_interfaces.items():
@@ -211,9 +418,9 @@ class SystemMonitor:
             return {"disabled": True}
         
         try:
-            if is_windows():
+            if IS_WINDOWS:
                 return self._get_windows_temperature()
-            elif is_linux():
+            elif IS_LINUX:
                 return self._get_linux_temperature()
             else:
                 return {"error": "Temperature monitoring not supported on this platform"}
@@ -258,100 +465,102 @@ class SystemMonitor:
         except Exception as e:
             return {"error": f"Windows temperature monitoring failed: {str(e)}"}
     
+    def _open_hwmon_sensors(self) -> List[tuple]:
+        """Discover hwmon inputs and keep them open for cheap re-reads"""
+        sensors = []
+        for kind, pattern in _HWMON_INPUTS:
+            for path in sorted(glob.glob(pattern)):
+                directory, filename = os.path.split(path)
+                base = filename[:-len("_input")]
+                name = base
+                try:
+                    with open(os.path.join(directory, f"{base}_label")) as label_file:
+                        name = label_file.read().strip()
+                except OSError:
+                    pass
+                try:
+                    with open(os.path.join(directory, "name")) as chip_file:
+                        name = f"{chip_file.read().strip()}:{name}"
+                except OSError:
+                    pass
+                try:
+                    sensors.append((kind, name, os.open(path, os.O_RDONLY)))
+                except OSError:
+                    continue
+        return sensors
+    
     def _get_linux_temperature(self) -> Dict[str, Any]:
-        """Get temperature information on Linux using sensors"""
+        """Get temperature information on Linux from hwmon, falling back to sensors"""
+        if self._hwmon_sensors is None:
+            self._hwmon_sensors = self._open_hwmon_sensors()
+        
+        if self._hwmon_sensors:
+            temperatures = []
+            fan_speeds = []
+            
+            for kind, name, fd in self._hwmon_sensors:
+                try:
+                    raw = int(os.pread(fd, 32, 0))
+                except (OSError, ValueError):
+                    # Some inputs report EIO/ENODATA while the device is idle
+                    continue
+                
+                if kind == "temperature":
+                    temperatures.append({
+                        "name": name,
+                        "value": raw / 1000.0,  # millidegrees
+                        "unit": "°C"
+                    })
+                else:
+                    fan_speeds.append({
+                        "name": name,
+                        "value": float(raw),
+                        "unit": "RPM"
+                    })
+            
+            return {
+                "temperatures": temperatures,
+                "fan_speeds": fan_speeds,
+                "source": "hwmon"
+            }
+        
         try:
+            # No hwmon inputs exposed, fall back to parsing sensors output
             result = subprocess.run(
-                ["sensors", "-A", "-j"],
+                ["sensors"],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
             
             if result.returncode == 0:
-                import json
-                sensors_data = json.loads(result.stdout)
-                
                 temperatures = []
                 fan_speeds = []
                 
-                for chip_name, chip_data in sensors_data.items():
-                    if isinstance(chip_data, dict):
-                        for sensor_name, sensor_data in chip_data.items():
-                            if isinstance(sensor_data, dict):
-                                # Look for temperature sensors
-                                for key, value in sensor_data.items():
-                                    if "temp" in key.lower() and "input" in key.lower():
-                                        temperatures.append({
-                                            "name": f"{chip_name}:{sensor_name}",
-                                            "value": float(value),
-                                            "unit": "°C"
-                                        })
-                                    elif "fan" in key.lower() and "input" in key.lower():
-                                        fan_speeds.append({
-                                            "name": f"{chip_name}:{sensor_name}",
-                                            "value": float(value),
-                                            "unit": "RPM"
-                                        })
+                for line in result.stdout.splitlines():
+                    match = _SENSORS_TEMP_RE.match(line)
+                    if match:
+                        temperatures.append({
+                            "name": match.group('name').strip(),
+                            "value": float(match.group('value')),
+                            "unit": "°C"
+                        })
+                        continue
+                    
+                    match = _SENSORS_FAN_RE.match(line)
+                    if match:
+                        fan_speeds.append({
+                            "name": match.group('name').strip(),
+                            "value": float(match.group('value')),
+                            "unit": "RPM"
+                        })
                 
                 return {
                     "temperatures": temperatures,
                     "fan_speeds": fan_speeds,
-                    "source": "lm-sensors"
+                    "source": "lm-sensors (text parsing)"
                 }
-            else:
-                # Fallback to simple sensors output parsing
-                result = subprocess.run(
-                    ["sensors"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.split('\n')
-                    temperatures = []
-                    fan_speeds = []
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if '°C' in line and ('Core' in line or 'temp' in line):
-                            # Parse temperature line
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                name = parts[0].strip()
-                                temp_part = parts[1].split('°C')[0].strip()
-                                try:
-                                    temp_value = float(temp_part.split()[-1])
-                                    temperatures.append({
-                                        "name": name,
-                                        "value": temp_value,
-                                        "unit": "°C"
-                                    })
-                                except ValueError:
-                                    continue
-                        elif 'RPM' in line and 'fan' in line.lower():
-                            # Parse fan speed line
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                name = parts[0].strip()
-                                rpm_part = parts[1].split('RPM')[0].strip()
-                                try:
-                                    rpm_value = float(rpm_part.split()[-1])
-                                    fan_speeds.append({
-                                        "name": name,
-                                        "value": rpm_value,
-                                        "unit": "RPM"
-                                    })
-                                except ValueError:
-                                    continue
-                    
-                    return {
-                        "temperatures": temperatures,
-                        "fan_speeds": fan_speeds,
-                        "source": "lm-sensors (text parsing)"
-                    }
-                
+            
             return {"error": "sensors command failed"}
             
         except subprocess.TimeoutExpired:
@@ -365,29 +574,55 @@ class SystemMonitor:
         """Get information about running processes"""
         try:
             processes = []
+            total_memory = psutil.virtual_memory().total
+            known = self._process_cache
+            seen: Dict[int, psutil.Process] = {}
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info']):
+            for proc in psutil.process_iter():
                 try:
-                    proc_info = proc.info
+                    pid = proc.pid
+                    cached = known.get(pid)
+                    if cached is None or cached != proc:
+                        # First sighting: cpu_percent() primes the counter and
+                        # returns 0.0, real usage is known on the next call
+                        cached = proc
+                    seen[pid] = cached
+                    
+                    # oneshot() shares one /proc/<pid>/stat read between
+                    # name() and cpu_percent() instead of re-reading per call
+                    with cached.oneshot():
+                        name = cached.name()
+                        cpu_percent = cached.cpu_percent(None)
+                        try:
+                            memory_rss = cached.memory_info().rss
+                        except psutil.AccessDenied:
+                            memory_rss = 0
+                    
                     processes.append({
-                        "pid": proc_info['pid'],
-                        "name": proc_info['name'],
-                        "cpu_percent": proc_info['cpu_percent'] or 0,
-                        "memory_percent": proc_info['memory_percent'] or 0,
-                        "memory_rss": proc_info['memory_info'].rss if proc_info['memory_info'] else 0,
-                        "memory_rss_formatted": format_bytes(proc_info['memory_info'].rss) if proc_info['memory_info'] else "0 B"
+                        "pid": pid,
+                        "name": name,
+                        "cpu_percent": cpu_percent,
+                        "memory_percent": (memory_rss / total_memory) * 100 if total_memory else 0,
+                        "memory_rss": memory_rss,
+                        "memory_rss_formatted": format_bytes(memory_rss)
                     })
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            # Sort by CPU usage and limit results
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
+            # Drop processes that have exited since the last call
+            self._process_cache = seen
+            
+            def by_cpu(p):
+                return p['cpu_percent']
+            
+            def by_memory(p):
+                return p['memory_percent']
             
             return {
                 "total_processes": len(processes),
-                "top_processes": processes[:limit],
-                "cpu_intensive": [p for p in processes if p['cpu_percent'] > 5.0][:5],
-                "memory_intensive": sorted(processes, key=lambda x: x['memory_percent'], reverse=True)[:5]
+                "top_processes": heapq.nlargest(limit, processes, key=by_cpu),
+                "cpu_intensive": heapq.nlargest(5, (p for p in processes if p['cpu_percent'] > 5.0), key=by_cpu),
+                "memory_intensive": heapq.nlargest(5, processes, key=by_memory)
             }
             
         except Exception as e:
@@ -395,33 +630,27 @@ class SystemMonitor:
     
     def get_system_summary(self) -> Dict[str, Any]:
         """Get a comprehensive system summary"""
+        snapshot = self._snapshot()
         return {
-            "system_info": {
-                "platform": platform.system(),
-                "platform_version": platform.version(),
-                "architecture": platform.architecture()[0],
-                "processor": platform.processor(),
-                "hostname": platform.node(),
-                "boot_time": psutil.boot_time()
-            },
+            "system_info": dict(_static_system_info()),
             "cpu": self.get_cpu_info(),
-            "memory": self.get_memory_info(),
-            "disk": self.get_disk_info(),
-            "network": self.get_network_info(),
+            "memory": self.get_memory_info(snapshot),
+            "disk": self.get_disk_info(snapshot),
+            "network": self.get_network_info(snapshot),
             "temperature": self.get_temperature_info(),
             "processes": self.get_process_info(5)  # Top 5 processes
         }
     
-    def get_current_metrics(self) -> SystemMetrics:
+    def get_current_metrics(self, snapshot: Optional[_Snapshot] = None) -> SystemMetrics:
         """Get current system metrics for monitoring"""
         try:
-            cpu_percent = psutil.cpu_percent()
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            network = psutil.net_io_counters()
+            snapshot = snapshot or self._snapshot()
+            memory = snapshot.virtual_memory
+            disk = snapshot.disk_usage
+            network = snapshot.net_io
             
             metrics = SystemMetrics(
-                cpu_percent=cpu_percent,
+                cpu_percent=snapshot.cpu_percent,
                 memory_percent=memory.percent,
                 memory_used=memory.used,
                 memory_total=memory.total,
@@ -433,9 +662,7 @@ class SystemMonitor:
             )
             
             # Add to history
-            self._metrics_history.append(metrics)
-            if len(self._metrics_history) > self.config.history_length:
-                self._metrics_history.pop(0)
+            self._record_metrics(metrics)
             
             return metrics
             
@@ -443,13 +670,36 @@ class SystemMonitor:
             # Return empty metrics on error
             return SystemMetrics(0, 0, 0, 0, 0, 0, 0, 0, 0)
     
+    def _record_metrics(self, metrics: SystemMetrics) -> None:
+        """Write a sample into the history ring buffer"""
+        index = self._history_head
+        for column, value in zip(self._history_columns, metrics):
+            column[index] = value
+        self._history_head = (index + 1) % self._history_size
+        if self._history_count < self._history_size:
+            self._history_count += 1
+    
+    def _history_indices(self) -> List[int]:
+        """Ring buffer indices of the stored samples, oldest first"""
+        size = self._history_size
+        start = (self._history_head - self._history_count) % size
+        return [(start + offset) % size for offset in range(self._history_count)]
+    
+    def get_metric_series(self, field: str) -> List[float]:
+        """Get the history of a single SystemMetrics field, oldest first"""
+        column = self._history_columns[SystemMetrics._fields.index(field)]
+        return [column[i] for i in self._history_indices()]
+    
     def get_metrics_history(self) -> List[SystemMetrics]:
         """Get historical metrics data"""
-        return self._metrics_history.copy()
+        columns = self._history_columns
+        return [SystemMetrics(*(column[i] for column in columns))
+                for i in self._history_indices()]
     
     def clear_history(self) -> None:
         """Clear metrics history"""
-        self._metrics_history.clear()
+        self._history_head = 0
+        self._history_count = 0
 
 # Factory function for easy instantiation
 def create_system_monitor(update_interval: int = 2, **kwargs) -> SystemMonitor:
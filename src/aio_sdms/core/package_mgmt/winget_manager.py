@@ -4,23 +4,36 @@ Extracted and refactored from winget_cli_tool
 Windows-specific package management using winget
 """
 
+import os
+import re
+import shutil
+import sys
+import select
 import subprocess
-import json
-import platform
-from typing import Dict, Any, List, Optional, NamedTuple
-from dataclasses import dataclass
+import tempfile
+import threading
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, NamedTuple, Callable, Iterable, Iterator, Tuple
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from aio_sdms.utils.utils import safe_execute, is_windows
+from aio_sdms.utils.utils import is_windows, DATACLASS_SLOTS
 from aio_sdms.utils.logger import get_logger
 
-class PackageInfo(NamedTuple):
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class PackageInfo:
     """Package information data structure"""
     id: str
     name: str
     version: str
     available_version: Optional[str] = None
     source: str = "winget"
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Field dict, as the former NamedTuple provided"""
+        return asdict(self)
 
 class PackageOperation(NamedTuple):
     """Package operation result"""
@@ -38,6 +51,282 @@ class PackageConfig:
     log_actions: bool = True
     timeout: int = 300  # 5 minutes
     silent_install: bool = True
+    max_parallel_operations: int = 4  # concurrent winget processes for batch operations
+
+class _AsyncLogWriter:
+    """Background thread that appends queued entries to a log file"""
+    
+    def __init__(self, path: Path):
+        self._path = path
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"log-writer-{path.name}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def write(self, entry: bytes) -> None:
+        """Queue an entry for writing"""
+        self._queue.put(entry)
+    
+    def flush(self) -> None:
+        """Block until every queued entry is written and flushed"""
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Drain the queue and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+    
+    def _run(self) -> None:
+        try:
+            fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        except OSError as e:
+            get_logger("PackageManager").error(f"Failed to open operation log: {str(e)}")
+            fd = None
+        
+        running = True
+        while running:
+            entries = [self._queue.get()]
+            # Coalesce the burst of queued entries into a single append
+            while True:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            count = len(entries)
+            try:
+                if None in entries:
+                    running = False
+                    entries = [entry for entry in entries if entry is not None]
+                if fd is not None and entries:
+                    data = memoryview(b"".join(entries))
+                    while data:
+                        data = data[os.write(fd, data):]
+            except Exception as e:
+                get_logger("PackageManager").error(f"Failed to log operation: {str(e)}")
+            finally:
+                for _ in range(count):
+                    self._queue.task_done()
+        
+        if fd is not None:
+            os.close(fd)
+
+# One writer per log file, shared by all PackageManager instances
+_log_writers: Dict[Path, _AsyncLogWriter] = {}
+_log_writers_lock = threading.Lock()
+
+def _get_log_writer(path: Path) -> _AsyncLogWriter:
+    """Get the shared background writer for a log file"""
+    key = path.resolve()
+    with _log_writers_lock:
+        writer = _log_writers.get(key)
+        if writer is None:
+            writer = _log_writers[key] = _AsyncLogWriter(path)
+        return writer
+
+def _flush_log_writer(path: Path) -> None:
+    """Wait for pending entries of a log file, if it has a writer"""
+    writer = _log_writers.get(path.resolve())
+    if writer is not None:
+        writer.flush()
+
+# One operation log entry: "<iso timestamp> | <OP> | <package id> | <STATUS> | <message>"
+_LOG_RE = re.compile(
+    r'^(?P<ts>\S+) \| (?P<op>[A-Z]+) \| (?P<id>[^|]+?) \| (?P<status>SUCCESS|FAILED) \| (?P<msg>.*)$'
+)
+_OP_INTERN = {'INSTALL': 'install', 'UNINSTALL': 'uninstall', 'UPGRADE': 'upgrade'}
+_LOG_TMPL = b"%b | %b | %b | %b | %b\n"
+_OP_LABELS = {'install': b'INSTALL', 'uninstall': b'UNINSTALL', 'upgrade': b'UPGRADE'}
+_SUCCESS = b"SUCCESS"
+_FAILED = b"FAILED"
+
+# Package ids, names and versions are passed as single arguments, so only values
+# winget would misread are rejected: option-like or multi-line ones, and very long ones
+_UNSAFE_ARG_RE = re.compile(r'^-|[\x00-\x1f\x7f]')
+_MAX_ARG_LEN = 256
+
+# Options _run_winget_op callers add themselves; every other argument is a value
+_OP_FLAGS = frozenset(("--version", "--all"))
+
+# winget tables start after the first line with "Name" (column titles) or "---" (rule)
+_HEADER_RE = re.compile(r'---|Name')
+
+def _body_after_header(output: str) -> str:
+    """Text following the header line of a winget table, or "" if there is none"""
+    match = _HEADER_RE.search(output)
+    if match is None:
+        return ""
+    end = output.find('\n', match.end())
+    return output[end + 1:] if end >= 0 else ""
+
+def _tail_lines(path: Path, count: int, chunk_size: int = 64 * 1024) -> List[str]:
+    """Read the last `count` lines of a file by scanning back from its end"""
+    if count <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        window = chunk_size
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).splitlines()
+            # One extra line is needed because the first may be cut mid-way
+            if start == 0 or len(lines) > count:
+                break
+            window *= 2
+    
+    if start > 0:
+        lines = lines[1:]
+    return [line.decode('utf-8', errors='replace') for line in lines[-count:]]
+
+def _hidden_window_kwargs() -> Dict[str, Any]:
+    """Popen keyword arguments that keep child processes from opening a console window"""
+    if not hasattr(subprocess, "STARTUPINFO"):
+        return {}
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": startupinfo}
+
+_WAIT_TIMEOUT = 0x102
+
+def _wait_for_exit(process: subprocess.Popen, timeout: float) -> int:
+    """Block until a child exits using a kernel wait instead of polling Popen.wait"""
+    handle = getattr(process, "_handle", None)
+    if handle is not None:
+        # Windows: wake exactly once, when the process handle is signalled
+        import ctypes
+        if ctypes.windll.kernel32.WaitForSingleObject(int(handle), int(timeout * 1000)) == _WAIT_TIMEOUT:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        return process.wait()
+    
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None and hasattr(select, "poll"):
+        try:
+            fd = pidfd_open(process.pid)
+        except OSError:
+            return process.wait(timeout=timeout)
+        try:
+            # Linux: the pidfd becomes readable when the process exits
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            if not poller.poll(timeout * 1000):
+                raise subprocess.TimeoutExpired(process.args, timeout)
+        finally:
+            os.close(fd)
+        return process.wait()
+    
+    return process.wait(timeout=timeout)
+
+class _WingetSession:
+    """Long-lived PowerShell host that runs winget commands sent over stdin"""
+    
+    _SENTINEL = "---AIO-SDMS-END---"
+    
+    def __init__(self, winget_exe: str = "winget", popen_kwargs: Optional[Dict[str, Any]] = None):
+        self._winget_exe = winget_exe
+        self._popen_kwargs = popen_kwargs or {}
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the PowerShell host if it is not running"""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                **self._popen_kwargs
+            )
+            self._process.stdin.write("[Console]::OutputEncoding = [Text.Encoding]::UTF8\n")
+        return self._process
+    
+    @staticmethod
+    def _quote(arg: str) -> str:
+        """Quote an argument as a PowerShell single-quoted literal"""
+        return "'" + arg.replace("'", "''") + "'"
+    
+    def run(self, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run `winget <args>` in the session (stderr merged into stdout)"""
+        output = self.stream(args, timeout)
+        stdout = "".join(output)
+        return subprocess.CompletedProcess(args, output.returncode, stdout, "")
+    
+    def stream(self, args: List[str], timeout: float) -> "_SessionOutput":
+        """Run `winget <args>` in the session and iterate its output lines"""
+        command = " ".join(self._quote(arg) for arg in args)
+        return _SessionOutput(
+            self,
+            f"& {self._quote(self._winget_exe)} {command} 2>&1 | ForEach-Object {{ \"$_\" }}",
+            timeout,
+            "$LASTEXITCODE"
+        )
+    
+    def run_script(self, script: str, timeout: float,
+                   exit_code: str = "$(if ($?) {0} else {1})") -> subprocess.CompletedProcess:
+        """Run a one-line PowerShell script in the session and collect its output"""
+        output = _SessionOutput(self, script, timeout, exit_code)
+        stdout = "".join(output)
+        return subprocess.CompletedProcess(script, output.returncode, stdout, "")
+    
+    def _iter_output(self, script: str, timeout: float, exit_code: str,
+                     output: "_SessionOutput") -> Iterator[str]:
+        """Send a script to the host and yield its output lines up to the sentinel"""
+        with self._lock:
+            process = self._ensure_started()
+            process.stdin.write(f"{script}; Write-Output ('{self._SENTINEL}' + {exit_code})\n")
+            process.stdin.flush()
+            
+            # A hung command is killed, which ends the read loop with EOF
+            timer = threading.Timer(timeout, process.kill)
+            timer.start()
+            try:
+                for line in process.stdout:
+                    if line.startswith(self._SENTINEL):
+                        output.returncode = int(line[len(self._SENTINEL):].strip() or 0)
+                        break
+                    yield line
+            finally:
+                timer.cancel()
+                # Timed out or abandoned mid-command: the host is out of sync, discard it
+                if output.returncode is None:
+                    process.kill()
+                    process.wait()
+                    self._process = None
+            
+            if output.returncode is None:
+                raise subprocess.TimeoutExpired(script, timeout)
+    
+    def close(self) -> None:
+        """Stop the PowerShell host"""
+        with self._lock:
+            if self._process is not None:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._process.kill()
+                self._process = None
+
+class _SessionOutput:
+    """Output lines of one session command; returncode is set once fully read"""
+    
+    def __init__(self, session: _WingetSession, script: str, timeout: float, exit_code: str):
+        self.returncode: Optional[int] = None
+        self._lines = session._iter_output(script, timeout, exit_code, self)
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._lines
+    
+    def close(self) -> None:
+        """Stop reading early, discarding the rest of the command"""
+        self._lines.close()
 
 class PackageManager:
     """Core package management functionality"""
@@ -46,45 +335,172 @@ class PackageManager:
         self.config = config or PackageConfig()
         self.logger = get_logger("PackageManager")
         self._log_file = Path("package_operations.log")
+        self._is_windows = is_windows()
+        # Absolute path of winget, so spawns skip the PATH search
+        self._winget_exe = self._find_winget()
+        # Spawn options shared by every winget/PowerShell child (no console window on Windows)
+        self._popen_kwargs = _hidden_window_kwargs()
+        # Result of the `winget --version` probe, None until first checked
+        self._winget_available: Optional[bool] = None
+        # Version string reported by that probe
+        self._winget_version: Optional[str] = None
+        # Shared PowerShell host for read-only queries, started on first use
+        self._session: Optional[_WingetSession] = None
+        # Threaded callers (the web server) must not start two hosts
+        self._session_lock = threading.Lock()
+        # Whether the Microsoft.WinGet.Client cmdlets answered with JSON
+        self._json_supported: Optional[bool] = None
+        # Bounds how many winget processes batch operations run at once
+        self._operation_slots = threading.Semaphore(max(1, self.config.max_parallel_operations))
         
-        if not is_windows():
+        if not self._is_windows:
             self.logger.warning("Package manager is designed for Windows only")
     
+    def _find_winget(self) -> str:
+        """Resolve winget to an absolute path, falling back to the bare name"""
+        if not self._is_windows:
+            return "winget"
+        return shutil.which("winget") or "winget"
+    
     def is_available(self) -> bool:
-        """Check if winget is available on the system"""
-        if not is_windows():
+        """Check if winget is available on the system (probed once)"""
+        if self._winget_available is not None:
+            return self._winget_available
+        
+        if not self._is_windows:
+            self._winget_available = False
             return False
         
         try:
             result = subprocess.run(
-                ["winget", "--version"],
-                capture_output=True,
+                [self._winget_exe, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=10
+                timeout=10,
+                **self._popen_kwargs
             )
-            return result.returncode == 0
+            self._winget_available = result.returncode == 0
+            self._winget_version = (result.stdout.strip() or None) if self._winget_available else None
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            self._winget_available = False
+            self._winget_version = None
+        
+        return self._winget_available
     
-    def get_installed_packages(self) -> List[PackageInfo]:
-        """Get list of installed packages"""
+    def get_version(self) -> Optional[str]:
+        """winget version from the availability probe, None if unavailable"""
+        return self._winget_version if self.is_available() else None
+    
+    def refresh_availability(self) -> bool:
+        """Forget the cached winget probe and check again"""
+        self._winget_available = None
+        winget_exe = self._find_winget()
+        if winget_exe != self._winget_exe:
+            self._winget_exe = winget_exe
+            # The session still points at the old executable
+            self.close()
+        return self.is_available()
+    
+    def __enter__(self) -> "PackageManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the shared winget session, if one was started"""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+    
+    def _get_session(self) -> _WingetSession:
+        """Get the shared winget session, creating it on first use"""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _WingetSession(self._winget_exe, self._popen_kwargs)
+                session = self._session
+        return session
+    
+    def _query(self, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run a read-only winget command through the shared session"""
+        return self._get_session().run(args, timeout)
+    
+    def _query_json(self, script: str, timeout: float) -> Optional[List[Dict[str, Any]]]:
+        """Run a WinGet.Client cmdlet pipeline and decode its JSON rows"""
+        # None means the cmdlets are unavailable or this call failed; callers
+        # then fall back to parsing winget's text tables
+        if self._json_supported is False:
+            return None
+        
+        result = self._get_session().run_script(
+            f"{script} | ConvertTo-Json -Depth 3 -Compress", timeout
+        )
+        output = result.stdout.strip()
+        if result.returncode != 0:
+            self._json_probe_failed()
+            return None
+        
+        # Only needed once the cmdlets are known to work
+        import json
+        
+        try:
+            rows = json.loads(output) if output else []
+        except json.JSONDecodeError:
+            self._json_probe_failed()
+            return None
+        
+        self._json_supported = True
+        # ConvertTo-Json emits a bare object for a single row
+        return [rows] if isinstance(rows, dict) else rows
+    
+    def _json_probe_failed(self) -> None:
+        """Give up on the cmdlets only if they have never worked"""
+        # Once they have answered, a failure is that query's problem (network,
+        # source errors), so later queries still try JSON first
+        if self._json_supported is None:
+            self._json_supported = False
+    
+    @staticmethod
+    def _package_from_json(row: Dict[str, Any]) -> PackageInfo:
+        """Build a PackageInfo from a Get-/Find-WinGetPackage JSON row"""
+        available_versions = row.get("AvailableVersions") or []
+        return PackageInfo(
+            id=row.get("Id") or "",
+            name=row.get("Name") or "",
+            version=sys.intern(row.get("InstalledVersion") or row.get("Version") or ""),
+            available_version=available_versions[0] if row.get("IsUpdateAvailable") and available_versions else None,
+            source=sys.intern(row.get("Source") or "winget")
+        )
+    
+    def iter_installed_packages(self) -> Iterator[PackageInfo]:
+        """Yield installed packages as winget reports them"""
         if not self.is_available():
-            return []
+            return
         
+        rows = self._query_json("Get-WinGetPackage", timeout=60)
+        if rows is not None:
+            for row in rows:
+                yield self._package_from_json(row)
+            return
+        
+        output = self._get_session().stream(["list", "--accept-source-agreements"], timeout=60)
         try:
-            result = subprocess.run(
-                ["winget", "list", "--accept-source-agreements"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                return self._parse_package_list(result.stdout)
-            else:
-                self.logger.error(f"Failed to get installed packages: {result.stderr}")
-                return []
-                
+            yield from self._iter_package_list(output)
+        finally:
+            # Releases the session if the caller stops early
+            output.close()
+        # Rows already yielded came from a failed command; let callers discard them
+        if output.returncode != 0:
+            raise subprocess.CalledProcessError(output.returncode, ["winget", "list"])
+    
+    def get_installed_packages(self) -> List[PackageInfo]:
+        """Get list of installed packages"""
+        try:
+            return list(self.iter_installed_packages())
         except subprocess.TimeoutExpired:
             self.logger.error("Timeout while getting installed packages")
             return []
@@ -92,23 +508,40 @@ class PackageManager:
             self.logger.error(f"Error getting installed packages: {str(e)}")
             return []
     
+    def get_installed_packages_columnar(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get installed packages as parallel (ids, names, versions) lists"""
+        ids: List[str] = []
+        names: List[str] = []
+        versions: List[str] = []
+        try:
+            for package in self.iter_installed_packages():
+                ids.append(package.id)
+                names.append(package.name)
+                versions.append(package.version)
+        except subprocess.TimeoutExpired:
+            self.logger.error("Timeout while getting installed packages")
+            return [], [], []
+        except Exception as e:
+            self.logger.error(f"Error getting installed packages: {str(e)}")
+            return [], [], []
+        return ids, names, versions
+    
     def get_upgradable_packages(self) -> List[PackageInfo]:
         """Get list of packages that can be upgraded"""
         if not self.is_available():
             return []
         
         try:
-            result = subprocess.run(
-                ["winget", "upgrade", "--accept-source-agreements"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            rows = self._query_json("Get-WinGetPackage | Where-Object IsUpdateAvailable", timeout=60)
+            if rows is not None:
+                return [self._package_from_json(row) for row in rows]
+            
+            result = self._query(["upgrade", "--accept-source-agreements"], timeout=60)
             
             if result.returncode == 0:
                 return self._parse_upgrade_list(result.stdout)
             else:
-                self.logger.error(f"Failed to get upgradable packages: {result.stderr}")
+                self.logger.error(f"Failed to get upgradable packages: {result.stdout}")
                 return []
                 
         except subprocess.TimeoutExpired:
@@ -118,25 +551,45 @@ class PackageManager:
             self.logger.error(f"Error getting upgradable packages: {str(e)}")
             return []
     
+    def snapshot(self) -> Tuple[List[PackageInfo], List[PackageInfo]]:
+        """Get (installed, upgradable) packages, from one query when the cmdlets are available"""
+        installed = self.get_installed_packages()
+        if self._json_supported:
+            # Get-WinGetPackage rows already carry the available upgrade
+            return installed, [package for package in installed if package.available_version]
+        return installed, self.get_upgradable_packages()
+    
     def search_packages(self, query: str, limit: int = 20) -> List[PackageInfo]:
         """Search for packages"""
         if not self.is_available():
             return []
         
         try:
-            result = subprocess.run(
-                ["winget", "search", query, "--accept-source-agreements"],
-                capture_output=True,
-                text=True,
+            rows = self._query_json(
+                f"Find-WinGetPackage -Query {_WingetSession._quote(query)} | Select-Object -First {int(limit)}",
                 timeout=30
             )
+            if rows is not None:
+                return [self._package_from_json(row) for row in rows[:limit]]
             
-            if result.returncode == 0:
-                packages = self._parse_package_list(result.stdout)
-                return packages[:limit]
-            else:
-                self.logger.error(f"Failed to search packages: {result.stderr}")
+            output = self._get_session().stream(
+                ["search", query, "--count", str(int(limit)), "--accept-source-agreements"],
+                timeout=30
+            )
+            packages = []
+            try:
+                for package in self._iter_package_list(output):
+                    # A row past the limit: stop winget instead of parsing the rest
+                    if len(packages) >= limit:
+                        break
+                    packages.append(package)
+            finally:
+                output.close()
+            
+            if output.returncode not in (0, None):
+                self.logger.error(f"Failed to search packages (exit code {output.returncode})")
                 return []
+            return packages
                 
         except subprocess.TimeoutExpired:
             self.logger.error("Timeout while searching packages")
@@ -145,254 +598,126 @@ class PackageManager:
             self.logger.error(f"Error searching packages: {str(e)}")
             return []
     
-    def install_package(self, package_id: str, version: Optional[str] = None) -> PackageOperation:
-        """Install a package"""
+    def _run_winget_op(self, verb: str, package_id: str, args: List[str], progress: str, label: str,
+                       timeout_mult: int = 1) -> PackageOperation:
+        """Run a winget install/uninstall/upgrade command and record the outcome"""
+        now = datetime.now()
+        
         if not self.is_available():
             return PackageOperation(
                 package_id=package_id,
-                operation="install",
+                operation=verb,
                 success=False,
                 message="Winget not available",
-                timestamp=datetime.now()
+                timestamp=now
             )
         
+        for value in args:
+            if value not in _OP_FLAGS and (
+                    not value.strip() or len(value) > _MAX_ARG_LEN or _UNSAFE_ARG_RE.search(value)):
+                return PackageOperation(
+                    package_id=package_id,
+                    operation=verb,
+                    success=False,
+                    message=f"Invalid package id or version: {value!r}",
+                    timestamp=now
+                )
+        
+        cmd = [self._winget_exe, verb, *args, "--accept-source-agreements"]
+        if verb != "uninstall":
+            cmd.append("--accept-package-agreements")
+        if self.config.silent_install:
+            cmd.append("--silent")
+        
+        self.logger.info(progress)
+        
         try:
-            cmd = ["winget", "install", package_id, "--accept-source-agreements", "--accept-package-agreements"]
-            
-            if self.config.silent_install:
-                cmd.append("--silent")
-            
-            if version:
-                cmd.extend(["--version", version])
-            
-            self.logger.info(f"Installing package: {package_id}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="install",
-                success=result.returncode == 0,
-                message=result.stdout if result.returncode == 0 else result.stderr,
-                timestamp=datetime.now()
-            )
-            
-            if self.config.log_actions:
-                self._log_operation(operation)
-            
-            return operation
-            
+            # Output goes to temporary files, so no pipe-reader threads are needed
+            # while waiting and the wait itself is a single kernel wait
+            with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+                process = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, **self._popen_kwargs)
+                try:
+                    returncode = _wait_for_exit(process, self.config.timeout * timeout_mult)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
+                
+                success = returncode == 0
+                # Only the stream that becomes the message is read and decoded
+                output = stdout if success else stderr
+                output.seek(0)
+                message = output.read().decode('utf-8', errors='replace')
         except subprocess.TimeoutExpired:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="install",
-                success=False,
-                message="Installation timed out",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
-            
+            success, message = False, f"{label} timed out"
         except Exception as e:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="install",
-                success=False,
-                message=f"Installation failed: {str(e)}",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
+            success, message = False, f"{label} failed: {str(e)}"
+        
+        operation = PackageOperation(
+            package_id=package_id,
+            operation=verb,
+            success=success,
+            message=message,
+            timestamp=now
+        )
+        
+        if self.config.log_actions:
+            self._log_operation(operation)
+        
+        return operation
+    
+    def install_package(self, package_id: str, version: Optional[str] = None) -> PackageOperation:
+        """Install a package"""
+        args = [package_id, "--version", version] if version else [package_id]
+        return self._run_winget_op("install", package_id, args, f"Installing package: {package_id}", "Installation")
     
     def uninstall_package(self, package_id: str) -> PackageOperation:
         """Uninstall a package"""
-        if not self.is_available():
-            return PackageOperation(
-                package_id=package_id,
-                operation="uninstall",
-                success=False,
-                message="Winget not available",
-                timestamp=datetime.now()
-            )
-        
-        try:
-            cmd = ["winget", "uninstall", package_id, "--accept-source-agreements"]
-            
-            if self.config.silent_install:
-                cmd.append("--silent")
-            
-            self.logger.info(f"Uninstalling package: {package_id}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="uninstall",
-                success=result.returncode == 0,
-                message=result.stdout if result.returncode == 0 else result.stderr,
-                timestamp=datetime.now()
-            )
-            
-            if self.config.log_actions:
-                self._log_operation(operation)
-            
-            return operation
-            
-        except subprocess.TimeoutExpired:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="uninstall",
-                success=False,
-                message="Uninstallation timed out",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
-            
-        except Exception as e:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="uninstall",
-                success=False,
-                message=f"Uninstallation failed: {str(e)}",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
+        return self._run_winget_op("uninstall", package_id, [package_id], f"Uninstalling package: {package_id}", "Uninstallation")
     
     def upgrade_package(self, package_id: str) -> PackageOperation:
         """Upgrade a specific package"""
-        if not self.is_available():
-            return PackageOperation(
-                package_id=package_id,
-                operation="upgrade",
-                success=False,
-                message="Winget not available",
-                timestamp=datetime.now()
-            )
-        
-        try:
-            cmd = ["winget", "upgrade", package_id, "--accept-source-agreements", "--accept-package-agreements"]
-            
-            if self.config.silent_install:
-                cmd.append("--silent")
-            
-            self.logger.info(f"Upgrading package: {package_id}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="upgrade",
-                success=result.returncode == 0,
-                message=result.stdout if result.returncode == 0 else result.stderr,
-                timestamp=datetime.now()
-            )
-            
-            if self.config.log_actions:
-                self._log_operation(operation)
-            
-            return operation
-            
-        except subprocess.TimeoutExpired:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="upgrade",
-                success=False,
-                message="Upgrade timed out",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
-            
-        except Exception as e:
-            operation = PackageOperation(
-                package_id=package_id,
-                operation="upgrade",
-                success=False,
-                message=f"Upgrade failed: {str(e)}",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return operation
+        return self._run_winget_op("upgrade", package_id, [package_id], f"Upgrading package: {package_id}", "Upgrade")
     
     def upgrade_all_packages(self) -> List[PackageOperation]:
         """Upgrade all packages"""
         if not self.is_available():
             return []
         
-        try:
-            cmd = ["winget", "upgrade", "--all", "--accept-source-agreements", "--accept-package-agreements"]
-            
-            if self.config.silent_install:
-                cmd.append("--silent")
-            
-            self.logger.info("Upgrading all packages")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout * 3  # Longer timeout for bulk operations
-            )
-            
-            operation = PackageOperation(
-                package_id="all",
-                operation="upgrade",
-                success=result.returncode == 0,
-                message=result.stdout if result.returncode == 0 else result.stderr,
-                timestamp=datetime.now()
-            )
-            
-            if self.config.log_actions:
-                self._log_operation(operation)
-            
-            return [operation]
-            
-        except subprocess.TimeoutExpired:
-            operation = PackageOperation(
-                package_id="all",
-                operation="upgrade",
-                success=False,
-                message="Bulk upgrade timed out",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return [operation]
-            
-        except Exception as e:
-            operation = PackageOperation(
-                package_id="all",
-                operation="upgrade",
-                success=False,
-                message=f"Bulk upgrade failed: {str(e)}",
-                timestamp=datetime.now()
-            )
-            if self.config.log_actions:
-                self._log_operation(operation)
-            return [operation]
+        # Longer timeout for bulk operations
+        return [self._run_winget_op("upgrade", "all", ["--all"], "Upgrading all packages", "Bulk upgrade", timeout_mult=3)]
+    
+    def _run_batch(self, operation: Callable[[str], PackageOperation], package_ids: List[str],
+                   max_workers: Optional[int] = None) -> List[PackageOperation]:
+        """Run an operation for each package id on a thread pool, results in input order"""
+        if not package_ids:
+            return []
+        
+        def run_one(package_id: str) -> PackageOperation:
+            with self._operation_slots:
+                return operation(package_id)
+        
+        workers = max(1, min(max_workers or self.config.max_parallel_operations, len(package_ids)))
+        results: List[Optional[PackageOperation]] = [None] * len(package_ids)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_one, package_id): index
+                       for index, package_id in enumerate(package_ids)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def install_packages(self, package_ids: List[str], max_workers: Optional[int] = None) -> List[PackageOperation]:
+        """Install several packages concurrently"""
+        return self._run_batch(self.install_package, package_ids, max_workers)
+    
+    def uninstall_packages(self, package_ids: List[str], max_workers: Optional[int] = None) -> List[PackageOperation]:
+        """Uninstall several packages concurrently"""
+        return self._run_batch(self.uninstall_package, package_ids, max_workers)
+    
+    def upgrade_packages(self, package_ids: List[str], max_workers: Optional[int] = None) -> List[PackageOperation]:
+        """Upgrade several packages concurrently"""
+        return self._run_batch(self.upgrade_package, package_ids, max_workers)
     
     def get_package_info(self, package_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a package"""
@@ -400,12 +725,7 @@ class PackageManager:
             return None
         
         try:
-            result = subprocess.run(
-                ["winget", "show", package_id, "--accept-source-agreements"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._query(["show", package_id, "--accept-source-agreements"], timeout=30)
             
             if result.returncode == 0:
                 return self._parse_package_info(result.stdout)
@@ -421,12 +741,11 @@ class PackageManager:
             return []
         
         try:
-            result = subprocess.run(
-                ["winget", "source", "list"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            rows = self._query_json("Get-WinGetSource", timeout=30)
+            if rows is not None:
+                return [{"name": row.get("Name", ""), "argument": row.get("Argument", "")} for row in rows]
+            
+            result = self._query(["source", "list"], timeout=30)
             
             if result.returncode == 0:
                 return self._parse_sources(result.stdout)
@@ -443,10 +762,11 @@ class PackageManager:
         
         try:
             result = subprocess.run(
-                ["winget", "source", "add", "--name", name, "--arg", url],
-                capture_output=True,
-                text=True,
-                timeout=30
+                [self._winget_exe, "source", "add", "--name", name, "--arg", url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+                **self._popen_kwargs
             )
             
             return result.returncode == 0
@@ -461,10 +781,11 @@ class PackageManager:
         
         try:
             result = subprocess.run(
-                ["winget", "source", "remove", "--name", name],
-                capture_output=True,
-                text=True,
-                timeout=30
+                [self._winget_exe, "source", "remove", "--name", name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+                **self._popen_kwargs
             )
             
             return result.returncode == 0
@@ -474,72 +795,52 @@ class PackageManager:
     
     def _parse_package_list(self, output: str) -> List[PackageInfo]:
         """Parse winget list/search output"""
-        packages = []
-        lines = output.strip().split('\n')
+        return list(self._iter_package_list(output.splitlines()))
+    
+    def _iter_package_list(self, lines: Iterable[str]) -> Iterator[PackageInfo]:
+        """Parse winget list/search output incrementally, one line at a time"""
+        lines = iter(lines)
         
         # Skip header lines
-        data_start = -1
-        for i, line in enumerate(lines):
-            if '---' in line or 'Name' in line:
-                data_start = i + 1
+        for line in lines:
+            if _HEADER_RE.search(line):
                 break
         
-        if data_start == -1:
-            return packages
-        
-        for line in lines[data_start:]:
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
             
             # Simple parsing - this could be improved
-            parts = line.split()
-            if len(parts) >= 3:
-                name = ' '.join(parts[:-2])
-                package_id = parts[-2]
-                version = parts[-1]
+            parts = line.rsplit(None, 2)
+            if len(parts) == 3:
+                name, package_id, version = parts
                 
-                packages.append(PackageInfo(
+                yield PackageInfo(
                     id=package_id,
                     name=name,
-                    version=version
-                ))
-        
-        return packages
+                    version=sys.intern(version)
+                )
     
     def _parse_upgrade_list(self, output: str) -> List[PackageInfo]:
         """Parse winget upgrade output"""
         packages = []
-        lines = output.strip().split('\n')
-        
-        # Skip header lines
-        data_start = -1
-        for i, line in enumerate(lines):
-            if '---' in line or 'Name' in line:
-                data_start = i + 1
-                break
-        
-        if data_start == -1:
-            return packages
         
-        for line in lines[data_start:]:
+        for line in _body_after_header(output).splitlines():
             line = line.strip()
             if not line:
                 continue
             
             # Parse upgrade format: Name Id Version Available
-            parts = line.split()
-            if len(parts) >= 4:
-                name = ' '.join(parts[:-3])
-                package_id = parts[-3]
-                current_version = parts[-2]
-                available_version = parts[-1]
+            parts = line.rsplit(None, 3)
+            if len(parts) == 4:
+                name, package_id, current_version, available_version = parts
                 
                 packages.append(PackageInfo(
                     id=package_id,
                     name=name,
-                    version=current_version,
-                    available_version=available_version
+                    version=sys.intern(current_version),
+                    available_version=sys.intern(available_version)
                 ))
         
         return packages
@@ -560,28 +861,17 @@ class PackageManager:
     def _parse_sources(self, output: str) -> List[Dict[str, str]]:
         """Parse winget source list output"""
         sources = []
-        lines = output.strip().split('\n')
-        
-        # Skip header lines
-        data_start = -1
-        for i, line in enumerate(lines):
-            if '---' in line or 'Name' in line:
-                data_start = i + 1
-                break
         
-        if data_start == -1:
-            return sources
-        
-        for line in lines[data_start:]:
+        for line in _body_after_header(output).splitlines():
             line = line.strip()
             if not line:
                 continue
             
-            parts = line.split()
-            if len(parts) >= 2:
+            parts = line.split(None, 1)
+            if len(parts) == 2:
                 sources.append({
                     "name": parts[0],
-                    "argument": ' '.join(parts[1:])
+                    "argument": parts[1]
                 })
         
         return sources
@@ -589,34 +879,44 @@ class PackageManager:
     def _log_operation(self, operation: PackageOperation) -> None:
         """Log package operation to file"""
         try:
-            log_entry = f"{operation.timestamp.isoformat()} | {operation.operation.upper()} | {operation.package_id} | {'SUCCESS' if operation.success else 'FAILED'} | {operation.message}\n"
+            op = operation.operation
+            log_entry = _LOG_TMPL % (
+                operation.timestamp.isoformat().encode(),
+                _OP_LABELS.get(op) or op.upper().encode('utf-8'),
+                operation.package_id.encode('utf-8'),
+                _SUCCESS if operation.success else _FAILED,
+                operation.message.encode('utf-8')
+            )
             
-            with open(self._log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            _get_log_writer(self._log_file).write(log_entry)
                 
         except Exception as e:
             self.logger.error(f"Failed to log operation: {str(e)}")
     
     def get_operation_history(self, limit: int = 50) -> List[PackageOperation]:
         """Get recent package operations from log"""
+        # Make sure queued entries have reached the file
+        _flush_log_writer(self._log_file)
+        
         if not self._log_file.exists():
             return []
         
         try:
             operations = []
-            with open(self._log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Parse recent log entries
-            for line in reversed(lines[-limit:]):
-                parts = line.strip().split(' | ')
-                if len(parts) >= 5:
+            lines = _tail_lines(self._log_file, limit)
+            
+            # Parse recent log entries, skipping continuation lines of
+            # multi-line messages
+            for line in reversed(lines):
+                match = _LOG_RE.match(line.strip())
+                if match:
+                    op = match.group('op')
                     operations.append(PackageOperation(
-                        package_id=parts[2],
-                        operation=parts[1].lower(),
-                        success=parts[3] == 'SUCCESS',
-                        message=parts[4],
-                        timestamp=datetime.fromisoformat(parts[0])
+                        package_id=match.group('id'),
+                        operation=_OP_INTERN.get(op) or op.lower(),
+                        success=match.group('status') == 'SUCCESS',
+                        message=match.group('msg'),
+                        timestamp=datetime.fromisoformat(match.group('ts'))
                     ))
             
             return operations
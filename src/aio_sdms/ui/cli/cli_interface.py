@@ -2,16 +2,188 @@
 Command Line Interface for All-in-One System Tools
 """
 
+import os
 import sys
 import time
+import queue
+import threading
+import functools
+import itertools
+import selectors
+import contextlib
 from typing import Optional, Dict, Any
 from aio_sdms.utils.config import Config
 from aio_sdms.utils.logger import Logger
-from aio_sdms.core.battery.battery_monitor import create_battery_monitor
-from aio_sdms.core.diagnostics.hardware_tests import create_diagnostics
-from aio_sdms.core.monitoring.system_monitor import create_system_monitor
-from aio_sdms.core.package_mgmt.winget_manager import create_package_manager
-from aio_sdms.utils.utils import create_progress_bar, format_duration
+from aio_sdms.utils.utils import create_progress_bar, format_duration, format_bytes
+
+_RULE = "=" * 60
+_RULE_MINOR = "-" * 60
+
+def _block(*lines: str) -> str:
+    """Join display lines into one string, so a screen is emitted with a single write"""
+    return "\n".join(lines) + "\n"
+
+_MAIN_MENU = _block(
+    _RULE,
+    "          ALL-IN-ONE SYSTEM TOOLS - CLI",
+    _RULE,
+    "",
+    "Available Tools:",
+    "  1. Battery Monitor",
+    "  2. Hardware Diagnostics",
+    "  3. System Monitor",
+    "  4. Package Manager (Windows)",
+    "  5. System Summary",
+    "",
+    "  0. Exit",
+    ""
+)
+
+_BATTERY_HEADER = _block(
+    _RULE,
+    "                BATTERY MONITOR",
+    _RULE
+)
+
+_DIAGNOSTICS_MENU = _block(
+    _RULE,
+    "              HARDWARE DIAGNOSTICS",
+    _RULE,
+    "",
+    "1. Run All Tests",
+    "2. Run Individual Test",
+    "3. Back to Main Menu",
+    ""
+)
+
+_DIAGNOSTIC_RESULTS_HEADER = _block(
+    _RULE,
+    "              DIAGNOSTIC RESULTS",
+    _RULE
+)
+
+_SYSTEM_MONITOR_MENU = _block(
+    _RULE,
+    "                SYSTEM MONITOR",
+    _RULE,
+    "",
+    "1. Real-time Monitoring",
+    "2. System Summary",
+    "3. Temperature Info",
+    "4. Process Info",
+    "5. Back to Main Menu",
+    ""
+)
+
+_SYSTEM_SUMMARY_HEADER = _block(
+    _RULE,
+    "                SYSTEM SUMMARY",
+    _RULE
+)
+
+_DETAILED_SUMMARY_HEADER = _block(
+    _RULE,
+    "            DETAILED SYSTEM SUMMARY",
+    _RULE
+)
+
+_TEMPERATURE_HEADER = _block(
+    _RULE,
+    "              TEMPERATURE INFO",
+    _RULE
+)
+
+_PROCESS_HEADER = _block(
+    _RULE,
+    "               PROCESS INFO",
+    _RULE
+)
+
+_PACKAGE_MANAGER_HEADER = _block(
+    _RULE,
+    "               PACKAGE MANAGER",
+    _RULE
+)
+
+_PACKAGE_MENU = _block(
+    "",
+    "1. List Installed Packages",
+    "2. List Upgradable Packages",
+    "3. Search Packages",
+    "4. Install Package",
+    "5. Uninstall Package",
+    "6. Upgrade Package",
+    "7. Upgrade All Packages",
+    "8. Back to Main Menu",
+    ""
+)
+
+# Fixed top lines of the live views, which are redrawn in place
+_BATTERY_FRAME_HEADER = (_RULE, "                BATTERY MONITOR", _RULE, "")
+_REALTIME_FRAME_HEADER = (_RULE, "            REAL-TIME SYSTEM MONITOR", _RULE, "")
+# 1-based terminal row of the frame's "Last updated" line
+_REALTIME_STAMP_ROW = len(_REALTIME_FRAME_HEADER) + 9
+
+# Diagnostic status value -> display symbol
+_STATUS_SYMBOLS = {
+    'success': '✓',
+    'failed': '✗',
+    'warning': '⚠',
+    'skipped': '⏭',
+    'error': '❌'
+}
+
+# Tests offered by "Run Individual Test", in menu order
+_DIAGNOSTIC_TESTS = ('bluetooth', 'wifi', 'camera', 'microphone', 'speaker', 'keyboard', 'mouse')
+
+# Every 30-column bar the live view can show, indexed by whole percent
+_PROGRESS_BARS = tuple(create_progress_bar(percent, 100, 30) for percent in range(101))
+
+def _progress_bar(percent: float) -> str:
+    """Precomputed progress bar for a 0-100 percentage"""
+    return _PROGRESS_BARS[min(100, max(0, int(percent)))]
+
+# (epoch second, "HH:MM:SS") of the last formatted clock reading
+_last_ts = [0, ""]
+
+def _now_hms() -> str:
+    """Current wall-clock time as HH:MM:SS, formatted at most once per second"""
+    now = int(time.time())
+    cache = _last_ts
+    if cache[0] != now:
+        cache[0] = now
+        cache[1] = time.strftime('%H:%M:%S', time.localtime(now))
+    return cache[1]
+
+# How long a fetched package list is reused across package manager menu options
+_PACKAGE_SNAPSHOT_TTL = 30.0
+
+# Most search queries remembered per package manager session
+_SEARCH_CACHE_SIZE = 64
+
+# Seconds between real-time monitor samples and redraws
+_REALTIME_INTERVAL = 2.0
+
+# Tool modules are imported on first use, so a session only pays for the tools it opens
+@functools.lru_cache(maxsize=None)
+def _load_battery():
+    from aio_sdms.core.battery.battery_monitor import create_battery_monitor
+    return create_battery_monitor
+
+@functools.lru_cache(maxsize=None)
+def _load_diagnostics():
+    from aio_sdms.core.diagnostics.hardware_tests import create_diagnostics
+    return create_diagnostics
+
+@functools.lru_cache(maxsize=None)
+def _load_system_monitor():
+    from aio_sdms.core.monitoring.system_monitor import create_system_monitor
+    return create_system_monitor
+
+@functools.lru_cache(maxsize=None)
+def _load_package_manager():
+    from aio_sdms.core.package_mgmt.winget_manager import create_package_manager
+    return create_package_manager
 
 class CLIInterface:
     """Command Line Interface implementation"""
@@ -20,6 +192,41 @@ class CLIInterface:
         self.config = config
         self.logger = logger
         self._running = False
+        # Whether the terminal understands ANSI escapes, probed once
+        self._ansi_ok = self._enable_ansi()
+        self._clear_cmd = 'cls' if os.name == 'nt' else 'clear'
+        # Selector watching stdin for keypresses in the live views, created on first use
+        self._stdin_selector: Optional[selectors.BaseSelector] = None
+        # (fetched_at, installed, upgradable) from the package manager, reused for a short while
+        self._pkg_snapshot = None
+        # Non-empty search results by query, kept for one package manager session
+        self._search_cache: Dict[str, list] = {}
+        # Tool sections of the configuration, looked up once per tool
+        self._tool_cfg_cache: Dict[str, Dict[str, Any]] = {}
+        # Menu choice -> handler dispatch tables
+        self._main_menu = {
+            '0': self._exit,
+            '1': self._run_battery_monitor,
+            '2': self._run_diagnostics,
+            '3': self._run_system_monitor,
+            '4': self._run_package_manager,
+            '5': self._show_system_summary
+        }
+        self._system_menu = {
+            '1': self._run_realtime_monitoring,
+            '2': self._show_system_summary_detailed,
+            '3': self._show_temperature_info,
+            '4': self._show_process_info
+        }
+        self._package_menu = {
+            '1': self._list_installed_packages,
+            '2': self._list_upgradable_packages,
+            '3': self._search_packages,
+            '4': self._install_package,
+            '5': self._uninstall_package,
+            '6': self._upgrade_package,
+            '7': self._upgrade_all_packages
+        }
     
     def run(self, tool: Optional[str] = None):
         """Run the CLI interface"""
@@ -36,46 +243,34 @@ class CLIInterface:
         """Display and handle main menu"""
         while self._running:
             self._clear_screen()
-            print("=" * 60)
-            print("          ALL-IN-ONE SYSTEM TOOLS - CLI")
-            print("=" * 60)
-            print()
-            print("Available Tools:")
-            print("  1. Battery Monitor")
-            print("  2. Hardware Diagnostics")
-            print("  3. System Monitor")
-            print("  4. Package Manager (Windows)")
-            print("  5. System Summary")
-            print()
-            print("  0. Exit")
-            print()
+            self._write(_MAIN_MENU)
             
             try:
-                choice = input("Select a tool (0-5): ").strip()
-                
-                if choice == '0':
-                    self._running = False
-                    print("Goodbye!")
-                elif choice == '1':
-                    self._run_battery_monitor()
-                elif choice == '2':
-                    self._run_diagnostics()
-                elif choice == '3':
-                    self._run_system_monitor()
-                elif choice == '4':
-                    self._run_package_manager()
-                elif choice == '5':
-                    self._show_system_summary()
-                else:
-                    print("Invalid choice. Please try again.")
-                    time.sleep(1)
+                prompt = "Select a tool (0-5): "
+                handler = None
+                while handler is None:
+                    handler = self._main_menu.get(self._read_choice(prompt))
+                    # Re-prompt in place instead of pausing and redrawing the menu
+                    prompt = "Invalid choice. Select a tool (0-5): "
+                handler()
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 self._running = False
                 print("\nGoodbye!")
             except Exception as e:
                 print(f"Error: {e}")
-                time.sleep(2)
+                self._pause()
+    
+    def _exit(self):
+        """Leave the main menu"""
+        self._running = False
+        print("Goodbye!")
+    
+    def _tool_cfg(self, name: str) -> Dict[str, Any]:
+        """Configuration section for a tool, cached for the life of the CLI"""
+        if name not in self._tool_cfg_cache:
+            self._tool_cfg_cache[name] = self.config.get_tool_config(name)
+        return self._tool_cfg_cache[name]
     
     def _run_tool(self, tool_name: str):
         """Run a specific tool directly"""
@@ -95,24 +290,25 @@ class CLIInterface:
     def _run_battery_monitor(self):
         """Run battery monitoring tool"""
         self._clear_screen()
-        print("=" * 60)
-        print("                BATTERY MONITOR")
-        print("=" * 60)
+        self._write(_BATTERY_HEADER)
         
         # Get user configuration
-        config = self.config.get_tool_config('battery')
+        config = self._tool_cfg('battery')
+        default_wattage = config.get('charger_wattage', 65)
+        default_capacity = config.get('battery_capacity', 50000)
+        default_interval = config.get('update_interval', 5)
         
         try:
-            charger_wattage = float(input(f"Enter charger wattage (default: {config.get('charger_wattage', 65)}W): ") or config.get('charger_wattage', 65))
-            battery_capacity = float(input(f"Enter battery capacity (default: {config.get('battery_capacity', 50000)}mWh): ") or config.get('battery_capacity', 50000))
-            interval = int(input(f"Enter refresh interval (default: {config.get('update_interval', 5)}s): ") or config.get('update_interval', 5))
+            charger_wattage = float(input(f"Enter charger wattage (default: {default_wattage}W): ") or default_wattage)
+            battery_capacity = float(input(f"Enter battery capacity (default: {default_capacity}mWh): ") or default_capacity)
+            interval = int(input(f"Enter refresh interval (default: {default_interval}s): ") or default_interval)
         except ValueError:
             print("Invalid input, using default values.")
-            charger_wattage = config.get('charger_wattage', 65)
-            battery_capacity = config.get('battery_capacity', 50000)
-            interval = config.get('update_interval', 5)
+            charger_wattage = default_wattage
+            battery_capacity = default_capacity
+            interval = default_interval
         
-        monitor = create_battery_monitor(
+        monitor = _load_battery()(
             charger_wattage=charger_wattage,
             battery_capacity=battery_capacity,
             update_interval=interval
@@ -120,221 +316,247 @@ class CLIInterface:
         
         if not monitor.is_battery_available():
             print("No battery found on this system!")
-            input("Press Enter to continue...")
+            self._pause()
             return
         
-        print(f"\nMonitoring battery (refresh every {interval}s). Press Ctrl+C to stop...\n")
+        print(f"\nMonitoring battery (refresh every {interval}s). Press q or Ctrl+C to stop...\n")
         
         try:
             def display_battery_info(info):
-                self._clear_screen()
-                print("=" * 60)
-                print("                BATTERY MONITOR")
-                print("=" * 60)
-                print()
+                lines = list(_BATTERY_FRAME_HEADER)
                 
                 if 'error' in info:
-                    print(f"Error: {info['error']}")
+                    lines.append(f"Error: {info['error']}")
+                    self._draw_frame(lines)
                     return
                 
-                print(f"Battery Percentage: {info['percentage_formatted']}")
-                print(f"Status: {info['status']}")
+                lines.append(f"Battery Percentage: {info['percentage_formatted']}")
+                lines.append(f"Status: {info['status']}")
                 
                 if info['is_charging']:
                     if 'charging_rate_formatted' in info:
-                        print(f"Charging Rate: {info['charging_rate_formatted']}")
+                        lines.append(f"Charging Rate: {info['charging_rate_formatted']}")
                     if 'estimated_charging_time_formatted' in info:
-                        print(f"Time to Full: {info['estimated_charging_time_formatted']}")
+                        lines.append(f"Time to Full: {info['estimated_charging_time_formatted']}")
                 else:
                     if 'estimated_discharge_time_formatted' in info:
-                        print(f"Estimated Runtime: {info['estimated_discharge_time_formatted']}")
+                        lines.append(f"Estimated Runtime: {info['estimated_discharge_time_formatted']}")
                 
                 if info.get('low_battery'):
-                    print("\n⚠️  LOW BATTERY WARNING!")
+                    lines.extend(["", "⚠️  LOW BATTERY WARNING!"])
                 
-                print(f"\nLast updated: {time.strftime('%H:%M:%S')}")
-                print("Press Ctrl+C to stop monitoring")
+                lines.extend(["", f"Last updated: {_now_hms()}", "Press q or Ctrl+C to stop monitoring"])
+                self._draw_frame(lines)
             
-            monitor.start_monitoring(display_battery_info, interval)
+            with self._key_input():
+                monitor.start_monitoring(display_battery_info, interval, wait=self._quit_requested)
             
         except KeyboardInterrupt:
-            print("\nBattery monitoring stopped.")
+            pass
+        print("\nBattery monitoring stopped.")
         
-        input("Press Enter to continue...")
+        self._pause()
     
     def _run_diagnostics(self):
         """Run hardware diagnostics"""
         self._clear_screen()
-        print("=" * 60)
-        print("              HARDWARE DIAGNOSTICS")
-        print("=" * 60)
-        print()
-        print("1. Run All Tests")
-        print("2. Run Individual Test")
-        print("3. Back to Main Menu")
-        print()
+        self._write(_DIAGNOSTICS_MENU)
         
-        choice = input("Select option (1-3): ").strip()
+        choice = self._read_choice("Select option (1-3): ")
         
-        diagnostics = create_diagnostics()
+        diagnostics = _load_diagnostics()()
         
         if choice == '1':
-            print("\nRunning all diagnostic tests...")
-            print("This may take a while, please wait...\n")
+            self._clear_screen()
+            self._write(_DIAGNOSTIC_RESULTS_HEADER)
+            print("\nRunning all diagnostic tests, results appear as each one finishes...")
             
-            results = diagnostics.run_all_tests()
+            successful = 0
+            total = 0
+            for result in diagnostics.iter_all_tests():
+                self._print_diagnostic_result(result)
+                total += 1
+                successful += result.status.value == 'success'
             
-            self._display_diagnostic_results(results)
+            print(f"\nSummary: {successful}/{total} tests passed")
             
         elif choice == '2':
             self._run_individual_diagnostic(diagnostics)
             
         elif choice == '3':
             return
+            
+        else:
+            print("\aInvalid selection.")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _run_individual_diagnostic(self, diagnostics):
         """Run individual diagnostic test"""
-        tests = ['bluetooth', 'wifi', 'camera', 'microphone', 'speaker', 'keyboard', 'mouse']
+        tests = _DIAGNOSTIC_TESTS
         
         print("\nAvailable Tests:")
         for i, test in enumerate(tests, 1):
             print(f"  {i}. {test.title()}")
         
-        try:
-            choice = int(input(f"\nSelect test (1-{len(tests)}): ")) - 1
-            if 0 <= choice < len(tests):
-                test_name = tests[choice]
-                print(f"\nRunning {test_name} test...")
-                
-                result = diagnostics.run_single_test(test_name)
-                if result:
-                    self._display_diagnostic_results([result])
-                else:
-                    print("Test failed to run.")
+        key = self._read_choice(f"\nSelect test (1-{len(tests)}): ")
+        if len(key) == 1 and '1' <= key <= str(len(tests)):
+            test_name = tests[int(key) - 1]
+            print(f"\nRunning {test_name} test...")
+            
+            result = diagnostics.run_single_test(test_name)
+            if result:
+                self._display_diagnostic_results([result])
             else:
-                print("Invalid selection.")
-        except ValueError:
-            print("Invalid input.")
+                print("Test failed to run.")
+        else:
+            print("\aInvalid selection.")
     
     def _display_diagnostic_results(self, results):
         """Display diagnostic test results"""
         self._clear_screen()
-        print("=" * 60)
-        print("              DIAGNOSTIC RESULTS")
-        print("=" * 60)
-        
-        status_symbols = {
-            'success': '✓',
-            'failed': '✗',
-            'warning': '⚠',
-            'skipped': '⏭',
-            'error': '❌'
-        }
+        self._write(_DIAGNOSTIC_RESULTS_HEADER)
         
+        successful = 0
+        total = 0
         for result in results:
-            symbol = status_symbols.get(result.status.value, '?')
-            print(f"\n{symbol} {result.test_name.upper()}")
-            print(f"   Status: {result.status.value}")
-            print(f"   Message: {result.message}")
-            print(f"   Duration: {result.duration:.2f}s")
-            
-            if result.details:
-                print("   Details:")
-                for key, value in result.details.items():
-                    if isinstance(value, list) and key == 'devices':
-                        print(f"     {key}: {len(value)} found")
-                        for device in value[:3]:  # Show first 3
-                            print(f"       - {device}")
-                        if len(value) > 3:
-                            print(f"       ... and {len(value) - 3} more")
-                    else:
-                        print(f"     {key}: {value}")
+            self._print_diagnostic_result(result)
+            total += 1
+            successful += result.status.value == 'success'
         
         # Summary
-        successful = len([r for r in results if r.status.value == 'success'])
-        total = len(results)
         print(f"\nSummary: {successful}/{total} tests passed")
     
+    def _print_diagnostic_result(self, result):
+        """Print one diagnostic test result"""
+        symbol = _STATUS_SYMBOLS.get(result.status.value, '?')
+        print(f"\n{symbol} {result.test_name.upper()}")
+        print(f"   Status: {result.status.value}")
+        print(f"   Message: {result.message}")
+        print(f"   Duration: {result.duration:.2f}s")
+        
+        if result.details:
+            print("   Details:")
+            for key, value in result.details.items():
+                if isinstance(value, list) and key == 'devices':
+                    print(f"     {key}: {len(value)} found")
+                    for device in itertools.islice(value, 3):  # Show first 3
+                        print(f"       - {device}")
+                    if len(value) > 3:
+                        print(f"       ... and {len(value) - 3} more")
+                else:
+                    print(f"     {key}: {value}")
+    
     def _run_system_monitor(self):
         """Run system monitoring"""
         self._clear_screen()
-        print("=" * 60)
-        print("                SYSTEM MONITOR")
-        print("=" * 60)
-        print()
-        print("1. Real-time Monitoring")
-        print("2. System Summary")
-        print("3. Temperature Info")
-        print("4. Process Info")
-        print("5. Back to Main Menu")
-        print()
+        self._write(_SYSTEM_MONITOR_MENU)
         
-        choice = input("Select option (1-5): ").strip()
+        choice = self._read_choice("Select option (1-5): ")
         
-        monitor = create_system_monitor()
+        monitor = _load_system_monitor()(include_formatted=True)
         
-        if choice == '1':
-            self._run_realtime_monitoring(monitor)
-        elif choice == '2':
-            self._show_system_summary_detailed(monitor)
-        elif choice == '3':
-            self._show_temperature_info(monitor)
-        elif choice == '4':
-            self._show_process_info(monitor)
-        elif choice == '5':
+        if choice == '5':
             return
         
-        input("\nPress Enter to continue...")
+        handler = self._system_menu.get(choice)
+        if handler:
+            handler(monitor)
+        else:
+            print("\aInvalid selection.")
+        
+        self._pause("\nPress any key to continue...")
     
     def _run_realtime_monitoring(self, monitor):
         """Run real-time system monitoring"""
-        print("\nStarting real-time monitoring. Press Ctrl+C to stop...\n")
+        print("\nStarting real-time monitoring. Press q or Ctrl+C to stop...\n")
         
+        # Sampling runs on its own thread so slow metric reads don't stretch the redraw interval
+        samples: "queue.Queue" = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._sample_metrics, args=(monitor, samples, stop), daemon=True)
+        sampler.start()
         try:
-            while True:
+            with self._key_input():
+                self._realtime_loop(samples)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            sampler.join(timeout=_REALTIME_INTERVAL)
+        print("\nReal-time monitoring stopped.")
+    
+    def _sample_metrics(self, monitor, samples: "queue.Queue", stop: threading.Event):
+        """Keep only the newest metrics sample in the queue until stopped"""
+        while not stop.is_set():
+            try:
                 metrics = monitor.get_current_metrics()
+            except Exception as e:
+                metrics = e
+            try:
+                samples.get_nowait()
+            except queue.Empty:
+                pass
+            samples.put(metrics)
+            if isinstance(metrics, Exception):
+                return
+            stop.wait(_REALTIME_INTERVAL)
+    
+    def _realtime_loop(self, samples: "queue.Queue"):
+        """Redraw live metrics until q is pressed"""
+        fmt = format_bytes
+        last_key = None
+        metrics = samples.get()
+        while True:
+            try:
+                metrics = samples.get_nowait()
+            except queue.Empty:
+                pass  # No newer sample yet, show the last one again
+            if isinstance(metrics, Exception):
+                raise metrics
+            
+            # Values as shown on screen; when none changed only the timestamp is rewritten
+            key = (
+                round(metrics.cpu_percent, 1),
+                round(metrics.memory_percent, 1),
+                round(metrics.disk_percent, 1),
+                metrics.memory_used >> 20,
+                metrics.disk_used >> 30,
+                metrics.network_sent >> 20,
+                metrics.network_recv >> 20
+            )
+            if key == last_key and self._ansi_ok:
+                # Rewrite the timestamp, then park the cursor below the frame again
+                self._write(f"\x1b[{_REALTIME_STAMP_ROW};1H\x1b[KLast updated: {_now_hms()}"
+                            f"\x1b[{_REALTIME_STAMP_ROW + 2};1H")
+            else:
+                last_key = key
                 
-                self._clear_screen()
-                print("=" * 60)
-                print("            REAL-TIME SYSTEM MONITOR")
-                print("=" * 60)
-                print()
-                
-                # CPU
-                cpu_bar = create_progress_bar(int(metrics.cpu_percent), 100, 30)
-                print(f"CPU Usage:    {cpu_bar} {metrics.cpu_percent:.1f}%")
-                
-                # Memory
-                memory_bar = create_progress_bar(int(metrics.memory_percent), 100, 30)
-                print(f"Memory Usage: {memory_bar} {metrics.memory_percent:.1f}%")
-                
-                # Disk
-                disk_bar = create_progress_bar(int(metrics.disk_percent), 100, 30)
-                print(f"Disk Usage:   {disk_bar} {metrics.disk_percent:.1f}%")
-                
-                print(f"\nMemory: {self._format_bytes(metrics.memory_used)} / {self._format_bytes(metrics.memory_total)}")
-                print(f"Disk:   {self._format_bytes(metrics.disk_used)} / {self._format_bytes(metrics.disk_total)}")
-                print(f"Network: ↑{self._format_bytes(metrics.network_sent)} ↓{self._format_bytes(metrics.network_recv)}")
-                
-                print(f"\nLast updated: {time.strftime('%H:%M:%S')}")
-                print("Press Ctrl+C to stop")
-                
-                time.sleep(2)
-                
-        except KeyboardInterrupt:
-            print("\nReal-time monitoring stopped.")
+                lines = [
+                    *_REALTIME_FRAME_HEADER,
+                    f"CPU Usage:    {_progress_bar(metrics.cpu_percent)} {metrics.cpu_percent:.1f}%",
+                    f"Memory Usage: {_progress_bar(metrics.memory_percent)} {metrics.memory_percent:.1f}%",
+                    f"Disk Usage:   {_progress_bar(metrics.disk_percent)} {metrics.disk_percent:.1f}%",
+                    "",
+                    f"Memory: {fmt(metrics.memory_used)} / {fmt(metrics.memory_total)}",
+                    f"Disk:   {fmt(metrics.disk_used)} / {fmt(metrics.disk_total)}",
+                    f"Network: ↑{fmt(metrics.network_sent)} ↓{fmt(metrics.network_recv)}",
+                    "",
+                    f"Last updated: {_now_hms()}",
+                    "Press q or Ctrl+C to stop"
+                ]
+                self._draw_frame(lines)
+            
+            if self._quit_requested(_REALTIME_INTERVAL):
+                break
     
     def _show_system_summary(self):
         """Show basic system summary"""
-        monitor = create_system_monitor()
+        monitor = _load_system_monitor()(include_formatted=True)
         summary = monitor.get_system_summary()
         
         self._clear_screen()
-        print("=" * 60)
-        print("                SYSTEM SUMMARY")
-        print("=" * 60)
+        self._write(_SYSTEM_SUMMARY_HEADER)
         
         # System Info
         sys_info = summary['system_info']
@@ -360,7 +582,7 @@ class CLIInterface:
             print(f"\nDisk: {disk['percent_formatted']} used")
             print(f"Disk: {disk['used_formatted']} / {disk['total_formatted']}")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _show_system_summary_detailed(self, monitor):
         """Show detailed system summary"""
@@ -368,46 +590,56 @@ class CLIInterface:
         summary = monitor.get_system_summary()
         
         self._clear_screen()
-        print("=" * 60)
-        print("            DETAILED SYSTEM SUMMARY")
-        print("=" * 60)
+        self._write(_DETAILED_SUMMARY_HEADER)
         
         # System Info
         sys_info = summary['system_info']
-        print(f"\nSystem Information:")
-        print(f"  Platform: {sys_info['platform']} {sys_info['platform_version']}")
-        print(f"  Architecture: {sys_info['architecture']}")
-        print(f"  Hostname: {sys_info['hostname']}")
-        print(f"  Processor: {sys_info['processor']}")
+        print("\n".join([
+            "\nSystem Information:",
+            f"  Platform: {sys_info['platform']} {sys_info['platform_version']}",
+            f"  Architecture: {sys_info['architecture']}",
+            f"  Hostname: {sys_info['hostname']}",
+            f"  Processor: {sys_info['processor']}"
+        ]))
         
         # CPU
         cpu_info = summary['cpu']
         if 'error' not in cpu_info:
-            print(f"\nCPU Information:")
-            print(f"  Usage: {cpu_info['usage_percent']:.1f}%")
-            print(f"  Cores: {cpu_info['count_logical']} logical, {cpu_info['count_physical']} physical")
-            if cpu_info['frequency']:
-                freq = cpu_info['frequency']
-                print(f"  Frequency: {freq['current']:.0f} MHz (min: {freq['min']:.0f}, max: {freq['max']:.0f})")
+            lines = [
+                "\nCPU Information:",
+                f"  Usage: {cpu_info['usage_percent']:.1f}%",
+                f"  Cores: {cpu_info['count_logical']} logical, {cpu_info['count_physical']} physical"
+            ]
+            freq = cpu_info['frequency']
+            if freq:
+                cur, mn, mx = freq['current'], freq['min'], freq['max']
+                lines.append(f"  Frequency: {cur:.0f} MHz (min: {mn:.0f}, max: {mx:.0f})")
+            print("\n".join(lines))
         
         # Memory
         memory_info = summary['memory']
         if 'error' not in memory_info:
             virtual = memory_info['virtual']
             swap = memory_info['swap']
-            print(f"\nMemory Information:")
-            print(f"  Virtual: {virtual['percent_formatted']} used ({virtual['used_formatted']} / {virtual['total_formatted']})")
-            print(f"  Swap: {swap['percent_formatted']} used ({swap['used_formatted']} / {swap['total_formatted']})")
+            print("\n".join([
+                "\nMemory Information:",
+                f"  Virtual: {virtual['percent_formatted']} used ({virtual['used_formatted']} / {virtual['total_formatted']})",
+                f"  Swap: {swap['percent_formatted']} used ({swap['used_formatted']} / {swap['total_formatted']})"
+            ]))
         
         # Temperature
         temp_info = summary['temperature']
         if 'error' not in temp_info and not temp_info.get('disabled'):
-            print(f"\nTemperature Information:")
-            if 'temperatures' in temp_info:
-                for temp in temp_info['temperatures'][:5]:  # Show first 5
-                    print(f"  {temp['name']}: {temp['value']:.1f}{temp['unit']}")
-        
-        input("\nPress Enter to continue...")
+            lines = ["\nTemperature Information:"]
+            temperatures = temp_info.get('temperatures')
+            if temperatures is not None:
+                lines.extend(
+                    f"  {temp['name']}: {temp['value']:.1f}{temp['unit']}"
+                    for temp in itertools.islice(temperatures, 5)  # Show first 5
+                )
+            print("\n".join(lines))
+        
+        self._pause("\nPress any key to continue...")
     
     def _show_temperature_info(self, monitor):
         """Show temperature information"""
@@ -415,9 +647,7 @@ class CLIInterface:
         temp_info = monitor.get_temperature_info()
         
         self._clear_screen()
-        print("=" * 60)
-        print("              TEMPERATURE INFO")
-        print("=" * 60)
+        self._write(_TEMPERATURE_HEADER)
         
         if 'error' in temp_info:
             print(f"\nError: {temp_info['error']}")
@@ -443,9 +673,7 @@ class CLIInterface:
         proc_info = monitor.get_process_info(20)
         
         self._clear_screen()
-        print("=" * 60)
-        print("               PROCESS INFO")
-        print("=" * 60)
+        self._write(_PROCESS_HEADER)
         
         if 'error' in proc_info:
             print(f"\nError: {proc_info['error']}")
@@ -453,69 +681,52 @@ class CLIInterface:
             print(f"\nTotal Processes: {proc_info['total_processes']}")
             
             print("\nTop CPU Consumers:")
-            for proc in proc_info['cpu_intensive'][:10]:
+            for proc in itertools.islice(proc_info['cpu_intensive'], 10):
                 print(f"  {proc['name']} (PID: {proc['pid']}): {proc['cpu_percent']:.1f}% CPU")
             
             print("\nTop Memory Consumers:")
-            for proc in proc_info['memory_intensive'][:10]:
+            for proc in itertools.islice(proc_info['memory_intensive'], 10):
                 print(f"  {proc['name']} (PID: {proc['pid']}): {proc['memory_rss_formatted']} ({proc['memory_percent']:.1f}%)")
     
     def _run_package_manager(self):
         """Run package manager"""
         self._clear_screen()
-        print("=" * 60)
-        print("               PACKAGE MANAGER")
-        print("=" * 60)
-        
-        manager = create_package_manager()
-        
-        if not manager.is_available():
-            print("\nWinget is not available on this system.")
-            print("Package management is only supported on Windows with winget installed.")
-            input("Press Enter to continue...")
-            return
-        
-        while True:
-            print("\n1. List Installed Packages")
-            print("2. List Upgradable Packages")
-            print("3. Search Packages")
-            print("4. Install Package")
-            print("5. Uninstall Package")
-            print("6. Upgrade Package")
-            print("7. Upgrade All Packages")
-            print("8. Back to Main Menu")
-            print()
+        self._write(_PACKAGE_MANAGER_HEADER)
+        
+        # Closing the manager stops its PowerShell host when the menu is left
+        with _load_package_manager()() as manager:
+            if not manager.is_available():
+                print("\nWinget is not available on this system.")
+                print("Package management is only supported on Windows with winget installed.")
+                self._pause()
+                return
             
-            choice = input("Select option (1-8): ").strip()
+            self._pkg_snapshot = None
+            self._search_cache.clear()
             
-            if choice == '1':
-                self._list_installed_packages(manager)
-            elif choice == '2':
-                self._list_upgradable_packages(manager)
-            elif choice == '3':
-                self._search_packages(manager)
-            elif choice == '4':
-                self._install_package(manager)
-            elif choice == '5':
-                self._uninstall_package(manager)
-            elif choice == '6':
-                self._upgrade_package(manager)
-            elif choice == '7':
-                self._upgrade_all_packages(manager)
-            elif choice == '8':
-                break
-            else:
-                print("Invalid choice.")
+            while True:
+                self._write(_PACKAGE_MENU)
+                
+                choice = self._read_choice("Select option (1-8): ")
+                
+                if choice == '8':
+                    break
+                
+                handler = self._package_menu.get(choice)
+                if handler:
+                    handler(manager)
+                else:
+                    print("Invalid choice.")
     
     def _list_installed_packages(self, manager):
         """List installed packages"""
         print("\nFetching installed packages...")
-        packages = manager.get_installed_packages()
+        packages = self._package_snapshot(manager)[0]
         
         if packages:
             print(f"\nInstalled Packages ({len(packages)}):")
-            print("-" * 60)
-            for pkg in packages[:20]:  # Show first 20
+            print(_RULE_MINOR)
+            for pkg in itertools.islice(packages, 20):  # Show first 20
                 print(f"{pkg.name} ({pkg.id}) - v{pkg.version}")
             
             if len(packages) > 20:
@@ -523,16 +734,16 @@ class CLIInterface:
         else:
             print("No packages found or failed to retrieve package list.")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _list_upgradable_packages(self, manager):
         """List upgradable packages"""
         print("\nChecking for upgradable packages...")
-        packages = manager.get_upgradable_packages()
+        packages = self._package_snapshot(manager)[1]
         
         if packages:
             print(f"\nUpgradable Packages ({len(packages)}):")
-            print("-" * 60)
+            print(_RULE_MINOR)
             for pkg in packages:
                 print(f"{pkg.name} ({pkg.id})")
                 print(f"  Current: v{pkg.version} → Available: v{pkg.available_version}")
@@ -540,7 +751,15 @@ class CLIInterface:
         else:
             print("No upgrades available or failed to check for updates.")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
+    
+    def _package_snapshot(self, manager):
+        """Installed and upgradable packages, refetched once the snapshot is older than the TTL"""
+        now = time.monotonic()
+        if self._pkg_snapshot is None or now - self._pkg_snapshot[0] > _PACKAGE_SNAPSHOT_TTL:
+            installed, upgradable = manager.snapshot()
+            self._pkg_snapshot = (now, installed, upgradable)
+        return self._pkg_snapshot[1:]
     
     def _search_packages(self, manager):
         """Search for packages"""
@@ -549,17 +768,26 @@ class CLIInterface:
             return
         
         print(f"Searching for '{query}'...")
-        packages = manager.search_packages(query, 10)
+        # Repeated identical searches in one session are answered from memory
+        packages = self._search_cache.get(query)
+        if packages is None:
+            packages = manager.search_packages(query, 10)
+            # An empty result may be a timeout or failure, so only hits are kept
+            if packages:
+                if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+                    # Drop the oldest query
+                    del self._search_cache[next(iter(self._search_cache))]
+                self._search_cache[query] = packages
         
         if packages:
             print(f"\nSearch Results ({len(packages)}):")
-            print("-" * 60)
+            print(_RULE_MINOR)
             for pkg in packages:
                 print(f"{pkg.name} ({pkg.id}) - v{pkg.version}")
         else:
             print("No packages found.")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _install_package(self, manager):
         """Install a package"""
@@ -571,11 +799,12 @@ class CLIInterface:
         result = manager.install_package(package_id)
         
         if result.success:
+            self._pkg_snapshot = None
             print(f"✓ Successfully installed {package_id}")
         else:
             print(f"✗ Failed to install {package_id}: {result.message}")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _uninstall_package(self, manager):
         """Uninstall a package"""
@@ -591,11 +820,12 @@ class CLIInterface:
         result = manager.uninstall_package(package_id)
         
         if result.success:
+            self._pkg_snapshot = None
             print(f"✓ Successfully uninstalled {package_id}")
         else:
             print(f"✗ Failed to uninstall {package_id}: {result.message}")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _upgrade_package(self, manager):
         """Upgrade a specific package"""
@@ -607,11 +837,12 @@ class CLIInterface:
         result = manager.upgrade_package(package_id)
         
         if result.success:
+            self._pkg_snapshot = None
             print(f"✓ Successfully upgraded {package_id}")
         else:
             print(f"✗ Failed to upgrade {package_id}: {result.message}")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
     
     def _upgrade_all_packages(self, manager):
         """Upgrade all packages"""
@@ -621,6 +852,7 @@ class CLIInterface:
         
         print("Upgrading all packages...")
         results = manager.upgrade_all_packages()
+        self._pkg_snapshot = None
         
         for result in results:
             if result.success:
@@ -628,14 +860,124 @@ class CLIInterface:
             else:
                 print(f"✗ Failed to upgrade packages: {result.message}")
         
-        input("\nPress Enter to continue...")
+        self._pause("\nPress any key to continue...")
+    
+    @contextlib.contextmanager
+    def _key_input(self):
+        """Put the terminal in cbreak mode so single keypresses can be read, restoring it afterwards"""
+        if os.name == 'nt' or not sys.stdin.isatty():
+            yield
+            return
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    
+    def _wait_for_key(self, timeout: float) -> Optional[str]:
+        """Wait up to `timeout` seconds for a keypress; None if there was none"""
+        if os.name == 'nt':
+            import msvcrt
+            deadline = time.monotonic() + timeout
+            while True:
+                if msvcrt.kbhit():
+                    return msvcrt.getwch()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                time.sleep(min(0.05, remaining))
+        
+        if not sys.stdin.isatty():
+            time.sleep(timeout)
+            return None
+        
+        if self._stdin_selector is None:
+            self._stdin_selector = selectors.DefaultSelector()
+            self._stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+        if self._stdin_selector.select(timeout):
+            return os.read(sys.stdin.fileno(), 1).decode(errors='ignore')
+        return None
+    
+    def _read_key(self) -> str:
+        """Read a single keypress without waiting for Enter (a whole line when stdin is not a terminal)"""
+        if os.name == 'nt':
+            import msvcrt
+            key = msvcrt.getwch()
+            if key == '\x03':
+                raise KeyboardInterrupt
+            return key
+        
+        if not sys.stdin.isatty():
+            return input()
+        
+        with self._key_input():
+            return sys.stdin.read(1)
+    
+    def _read_choice(self, prompt: str) -> str:
+        """Show a menu prompt and return the key pressed, echoing it"""
+        self._write(prompt)
+        choice = self._read_key().strip()
+        if sys.stdin.isatty():
+            print(choice)
+        return choice
+    
+    def _pause(self, msg: str = "Press any key to continue..."):
+        """Wait for any keypress before returning to the menu"""
+        self._write(msg)
+        self._read_key()
+        if sys.stdin.isatty():
+            print()
+    
+    def _quit_requested(self, timeout: float) -> bool:
+        """Wait for the next refresh, returning True early if q is pressed"""
+        key = self._wait_for_key(timeout)
+        return key is not None and key.lower() == 'q'
+    
+    def _enable_ansi(self) -> bool:
+        """Check for (and on Windows, switch on) ANSI escape support in the console"""
+        if not sys.stdout.isatty():
+            return False
+        if os.name != 'nt':
+            return True
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except Exception:
+            return False
+    
+    def _write(self, text: str):
+        """Write prebuilt screen text in one call"""
+        sys.stdout.write(text)
+        sys.stdout.flush()
     
     def _clear_screen(self):
         """Clear the console screen"""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi_ok:
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
+        else:
+            os.system(self._clear_cmd)
+    
+    def _draw_frame(self, lines):
+        """Redraw a full-screen view in place"""
+        if self._ansi_ok:
+            # Overwrite from the top-left, erasing leftovers of the previous frame
+            sys.stdout.write("\x1b[H" + "\x1b[K\n".join(lines) + "\x1b[K\n\x1b[J")
+            sys.stdout.flush()
+        else:
+            self._clear_screen()
+            print("\n".join(lines))
     
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes for display"""
-        from core.common.utils import format_bytes
         return format_bytes(bytes_value)
\ No newline at end of file
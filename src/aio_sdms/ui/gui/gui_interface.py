@@ -5,9 +5,15 @@ Tkinter-based GUI implementation with themes, tray, and graphs
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import sys
+import asyncio
+import platform
 import threading
+import contextlib
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any
 from pathlib import Path
 from aio_sdms.utils.config import Config
 from aio_sdms.utils.logger import Logger
@@ -28,6 +34,61 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Refresh cadence, and how often a pending sample is checked for completion
+_TICK_MS = 2000
+_SAMPLE_POLL_MS = 50
+# Slower cadence while the window is minimised
+_ICONIC_TICK_MS = 5000
+
+# Battery polling slows to the idle cadence after this many unchanged readings
+_BATTERY_IDLE_MS = 10000
+_BATTERY_IDLE_AFTER = 3
+
+# Notebook tabs (Dashboard, Monitoring) that show the per-tick usage labels
+_USAGE_LABEL_TABS = (0, 2)
+
+_BYTES_TO_GB = 1.0 / (1024 ** 3)
+
+# Label templates for the per-tick percentage readouts
+_PERCENT_LABELS = {
+    'cpu_usage': "CPU Usage: {:.1f}%",
+    'mem_usage': "Memory Usage: {:.1f}%",
+    'disk_usage': "Disk Usage: {:.1f}%",
+    'cpu_percent': "Usage: {:.1f}%",
+    'mem_percent': "Usage: {:.1f}%",
+    'disk_percent': "Usage: {:.1f}%"
+}
+
+class _EventThread(threading.Thread):
+    """Daemon thread running an asyncio loop that all of the GUI's background work goes through"""
+    
+    def __init__(self, max_workers: int = 2):
+        super().__init__(name="gui-events", daemon=True)
+        self.loop = asyncio.new_event_loop()
+        # Blocking calls run on this pool, driven from the loop
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gui-worker")
+        self.loop.set_default_executor(self._executor)
+    
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+    
+    def submit(self, fn, *args) -> Future:
+        """Run a blocking callable off the Tk thread, returning a concurrent future for its result"""
+        return asyncio.run_coroutine_threadsafe(self._call(fn, *args), self.loop)
+    
+    async def _call(self, fn, *args):
+        return await self.loop.run_in_executor(None, fn, *args)
+    
+    def stop(self):
+        """Cancel outstanding work and stop the loop"""
+        def shutdown():
+            for task in asyncio.all_tasks(self.loop):
+                task.cancel()
+            self.loop.stop()
+        self.loop.call_soon_threadsafe(shutdown)
+        self._executor.shutdown(wait=False)
+
 class GUIInterface:
     """Graphical User Interface implementation using Tkinter"""
     
@@ -36,8 +97,18 @@ class GUIInterface:
         self.logger = logger
         self.root = None
         self.notebook = None
-        self._running = False
-        self._update_thread = None
+        # Pending after() callbacks for the refresh tick and the sample poll
+        self._after_id = None
+        self._poll_id = None
+        self._battery_after_id = None
+        # after() polls _when_done has scheduled and not yet run
+        self._done_poll_ids = set()
+        # Last battery (percentage, status) reading and how many polls it has held for
+        self._battery_state = None
+        self._battery_unchanged = 0
+        # Metrics and diagnostics run off the Tk thread; widgets are only touched from the Tk thread
+        self._event_thread = _EventThread()
+        self._sample_future = None
         
         # Initialize managers
         self.theme_manager = ThemeManager()
@@ -58,10 +129,41 @@ class GUIInterface:
         self.system_widgets = {}
         self.diagnostics_widgets = {}
         self.graph_widget = None
+        # (time, cpu, memory, disk) samples taken before the Graphs tab is built
+        self._graph_history = deque(maxlen=60)
+        # Notebook tab id -> builder, for tabs whose widgets have not been created yet
+        self._tab_builders = {}
+        # StringVars behind the labels refreshed every tick
+        self._vars: Dict[str, tk.StringVar] = {}
+        # Battery progress bar variable and the percentage it was last set to
+        self._battery_pct_var: Optional[tk.IntVar] = None
+        self._battery_pct: Optional[int] = None
+        # Last text written to each label, so unchanged values skip the Tk update
+        self._last_text: Dict[str, str] = {}
+        # Last rounded percentage per readout, so unchanged values skip formatting
+        self._last_percent: Dict[str, float] = {}
         
         # Notification state
         self.last_battery_alert = 0
         self.last_cpu_alert = 0
+        
+        # Host details that stay fixed for the session, read once
+        self._os_str = f"{platform.system()} {platform.release()}"
+        self._cpu_str = platform.processor()
+        self._disk_path = 'C:\\' if sys.platform == 'win32' else '/'
+        self._cpu_count = psutil.cpu_count() if PSUTIL_AVAILABLE else 0
+        self._ram_total_gb = psutil.virtual_memory().total * _BYTES_TO_GB if PSUTIL_AVAILABLE else 0.0
+        self._disk_total_gb = psutil.disk_usage(self._disk_path).total * _BYTES_TO_GB if PSUTIL_AVAILABLE else 0.0
+        
+        # Prime the CPU counters so non-blocking cpu_percent() calls measure since the previous tick
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)
+        else:
+            # Nothing to read without psutil, so the readers and battery polling become no-ops
+            self._read_metrics = lambda: (0, None, None)
+            self._update_system_info = lambda *readings: {}
+            self._update_battery_info = lambda: {}
+            self._battery_tick = lambda: None
     
     def run(self):
         """Run the GUI interface"""
@@ -92,14 +194,21 @@ class GUIInterface:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create tabs
-        self._create_dashboard_tab()
-        self._create_battery_tab()
-        self._create_monitoring_tab()
-        self._create_graphs_tab()
-        self._create_diagnostics_tab()
-        self._create_packages_tab()
-        self._create_settings_tab()
+        # Create tabs; the dashboard is built now, the others when first selected
+        for title, builder in (
+            ("Dashboard", self._create_dashboard_tab),
+            ("Battery", self._create_battery_tab),
+            ("Monitoring", self._create_monitoring_tab),
+            ("📊 Graphs", self._create_graphs_tab),
+            ("Diagnostics", self._create_diagnostics_tab),
+            ("Packages", self._create_packages_tab),
+            ("⚙️ Settings", self._create_settings_tab)
+        ):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = builder
+        self._build_tab(self.notebook.tabs()[0])
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
         
         # Initialize system tray
         if is_tray_available():
@@ -110,10 +219,11 @@ class GUIInterface:
             if self.tray_helper.start_tray():
                 self.logger.info("System tray icon started")
         
-        # Start update thread
-        self._running = True
-        self._update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self._update_thread.start()
+        # Start periodic updates
+        self._event_thread.start()
+        self._after_id = self.root.after(_TICK_MS, self._tick)
+        self._request_sample()
+        self._battery_tick()
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -170,11 +280,20 @@ class GUIInterface:
         help_menu.add_command(label="Documentation", command=self._show_documentation)
         help_menu.add_command(label="About", command=self._show_about)
     
-    def _create_dashboard_tab(self):
+    def _on_tab_change(self, event=None):
+        """Build the selected tab on first visit"""
+        self._build_tab(self.notebook.select())
+    
+    def _build_tab(self, tab_id: str):
+        """Fill in a tab's widgets unless that has already been done"""
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder is None:
+            return
+        builder(self.notebook.nametowidget(tab_id))
+        self._populate_static_info()
+    
+    def _create_dashboard_tab(self, frame):
         """Create dashboard overview tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Dashboard")
-        
         # Title
         title = ttk.Label(frame, text="System Overview Dashboard", font=("Arial", 16, "bold"))
         title.pack(pady=10)
@@ -200,47 +319,43 @@ class GUIInterface:
         stats_card = ttk.LabelFrame(overview_frame, text="Quick Stats", padding=10)
         stats_card.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
         
-        self.system_widgets['cpu_usage'] = ttk.Label(stats_card, text="CPU Usage: ---%", font=("Arial", 12))
+        self.system_widgets['cpu_usage'] = ttk.Label(stats_card, textvariable=self._label_var('cpu_usage', "CPU Usage: ---%"), font=("Arial", 12))
         self.system_widgets['cpu_usage'].pack(anchor='w', pady=5)
         
-        self.system_widgets['mem_usage'] = ttk.Label(stats_card, text="Memory Usage: ---%", font=("Arial", 12))
+        self.system_widgets['mem_usage'] = ttk.Label(stats_card, textvariable=self._label_var('mem_usage', "Memory Usage: ---%"), font=("Arial", 12))
         self.system_widgets['mem_usage'].pack(anchor='w', pady=5)
         
-        self.system_widgets['disk_usage'] = ttk.Label(stats_card, text="Disk Usage: ---%", font=("Arial", 12))
+        self.system_widgets['disk_usage'] = ttk.Label(stats_card, textvariable=self._label_var('disk_usage', "Disk Usage: ---%"), font=("Arial", 12))
         self.system_widgets['disk_usage'].pack(anchor='w', pady=5)
         
         overview_frame.columnconfigure(0, weight=1)
         overview_frame.columnconfigure(1, weight=1)
     
-    def _create_battery_tab(self):
+    def _create_battery_tab(self, frame):
         """Create battery monitoring tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Battery")
-        
         title = ttk.Label(frame, text="Battery Monitor", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
         info_frame = ttk.LabelFrame(frame, text="Battery Information", padding=20)
         info_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        self.battery_widgets['percent'] = ttk.Label(info_frame, text="Battery: ---%", font=("Arial", 24, "bold"))
+        self.battery_widgets['percent'] = ttk.Label(info_frame, textvariable=self._label_var('percent', "Battery: ---%"), font=("Arial", 24, "bold"))
         self.battery_widgets['percent'].pack(pady=10)
         
-        self.battery_widgets['status'] = ttk.Label(info_frame, text="Status: Unknown", font=("Arial", 12))
+        self.battery_widgets['status'] = ttk.Label(info_frame, textvariable=self._label_var('status', "Status: Unknown"), font=("Arial", 12))
         self.battery_widgets['status'].pack(pady=5)
         
-        self.battery_widgets['time'] = ttk.Label(info_frame, text="Time Remaining: Unknown")
+        self.battery_widgets['time'] = ttk.Label(info_frame, textvariable=self._label_var('time', "Time Remaining: Unknown"))
         self.battery_widgets['time'].pack(pady=5)
         
         # Progress bar
-        self.battery_widgets['progress'] = ttk.Progressbar(info_frame, length=400, mode='determinate')
+        self._battery_pct_var = tk.IntVar(master=self.root, value=0)
+        self.battery_widgets['progress'] = ttk.Progressbar(info_frame, length=400, mode='determinate',
+                                                           variable=self._battery_pct_var)
         self.battery_widgets['progress'].pack(pady=10)
     
-    def _create_monitoring_tab(self):
+    def _create_monitoring_tab(self, frame):
         """Create system monitoring tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Monitoring")
-        
         title = ttk.Label(frame, text="System Performance Monitor", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
@@ -248,7 +363,7 @@ class GUIInterface:
         cpu_frame = ttk.LabelFrame(frame, text="CPU", padding=10)
         cpu_frame.pack(fill=tk.X, padx=20, pady=5)
         
-        self.system_widgets['cpu_percent'] = ttk.Label(cpu_frame, text="Usage: ---%")
+        self.system_widgets['cpu_percent'] = ttk.Label(cpu_frame, textvariable=self._label_var('cpu_percent', "Usage: ---%"))
         self.system_widgets['cpu_percent'].pack(side=tk.LEFT, padx=10)
         
         self.system_widgets['cpu_cores'] = ttk.Label(cpu_frame, text="Cores: ---")
@@ -258,7 +373,7 @@ class GUIInterface:
         mem_frame = ttk.LabelFrame(frame, text="Memory", padding=10)
         mem_frame.pack(fill=tk.X, padx=20, pady=5)
         
-        self.system_widgets['mem_percent'] = ttk.Label(mem_frame, text="Usage: ---%")
+        self.system_widgets['mem_percent'] = ttk.Label(mem_frame, textvariable=self._label_var('mem_percent', "Usage: ---%"))
         self.system_widgets['mem_percent'].pack(side=tk.LEFT, padx=10)
         
         self.system_widgets['mem_total'] = ttk.Label(mem_frame, text="Total: ---")
@@ -268,17 +383,14 @@ class GUIInterface:
         disk_frame = ttk.LabelFrame(frame, text="Disk", padding=10)
         disk_frame.pack(fill=tk.X, padx=20, pady=5)
         
-        self.system_widgets['disk_percent'] = ttk.Label(disk_frame, text="Usage: ---%")
+        self.system_widgets['disk_percent'] = ttk.Label(disk_frame, textvariable=self._label_var('disk_percent', "Usage: ---%"))
         self.system_widgets['disk_percent'].pack(side=tk.LEFT, padx=10)
         
         self.system_widgets['disk_total'] = ttk.Label(disk_frame, text="Total: ---")
         self.system_widgets['disk_total'].pack(side=tk.LEFT, padx=10)
     
-    def _create_diagnostics_tab(self):
+    def _create_diagnostics_tab(self, frame):
         """Create hardware diagnostics tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Diagnostics")
-        
         title = ttk.Label(frame, text="Hardware Diagnostics", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
@@ -292,34 +404,31 @@ class GUIInterface:
         results_frame = ttk.LabelFrame(frame, text="Test Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        self.diagnostics_widgets['results'] = tk.Text(results_frame, height=15, width=80, wrap=tk.WORD)
+        self.diagnostics_widgets['results'] = tk.Text(results_frame, height=15, width=80, wrap=tk.WORD,
+                                                      undo=False, maxundo=0, state='disabled')
         self.diagnostics_widgets['results'].pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(results_frame, command=self.diagnostics_widgets['results'].yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.diagnostics_widgets['results'].config(yscrollcommand=scrollbar.set)
     
-    def _create_packages_tab(self):
+    def _create_packages_tab(self, frame):
         """Create package management tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Packages")
-        
         title = ttk.Label(frame, text="Package Manager (Windows Only)", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
         info = ttk.Label(frame, text="Package management features available through CLI.\nUse: python main.py --cli packages")
         info.pack(pady=20)
     
-    def _create_graphs_tab(self):
+    def _create_graphs_tab(self, frame):
         """Create performance graphs tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="📊 Graphs")
-        
         title = ttk.Label(frame, text="Performance Graphs", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
         # Create graph widget
         self.graph_widget = PerformanceGraph(frame, "System Performance", max_points=60)
+        self.graph_widget.load_history(self._graph_history)
+        self._graph_history.clear()
         
         # Info label
         if is_matplotlib_available():
@@ -328,11 +437,8 @@ class GUIInterface:
             info = ttk.Label(frame, text="Install matplotlib for live graphs: pip install matplotlib")
         info.pack(pady=5)
     
-    def _create_settings_tab(self):
+    def _create_settings_tab(self, frame):
         """Create settings tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="⚙️ Settings")
-        
         title = ttk.Label(frame, text="Application Settings", font=("Arial", 14, "bold"))
         title.pack(pady=10)
         
@@ -377,6 +483,25 @@ class GUIInterface:
         ttk.Button(export_frame, text="Export System Report", 
                   command=self._export_report).pack(pady=5)
     
+    def _populate_static_info(self):
+        """Fill in labels whose values do not change during a session"""
+        if not PSUTIL_AVAILABLE:
+            return
+        
+        static = {
+            'os_label': f"OS: {self._os_str}",
+            'cpu_label': f"CPU: {self._cpu_str}",
+            'ram_label': f"RAM: {self._ram_total_gb:.1f} GB",
+            'cpu_cores': f"Cores: {self._cpu_count}",
+            'mem_total': f"Total: {self._ram_total_gb:.1f} GB",
+            'disk_total': f"Total: {self._disk_total_gb:.1f} GB"
+        }
+        # Tabs are built lazily, so only the labels created so far are filled in
+        for key, text in static.items():
+            widget = self.system_widgets.get(key)
+            if widget is not None:
+                self._set_text(widget, key, text)
+    
     # Menu command implementations
     def _toggle_theme(self):
         """Toggle between light and dark theme"""
@@ -476,173 +601,289 @@ class GUIInterface:
                               "- IMPROVEMENTS_SUMMARY.md\n"
                               "- WEB_INTERFACE_GUIDE.md")
     
-    def _update_loop(self):
-        """Background update loop with resource monitoring and notifications"""
-        while self._running:
-            try:
-                # Get current metrics
-                cpu_percent = psutil.cpu_percent(interval=0.5) if PSUTIL_AVAILABLE else 0
-                mem = psutil.virtual_memory() if PSUTIL_AVAILABLE else None
-                mem_percent = mem.percent if mem else 0
-                disk = psutil.disk_usage('/') if PSUTIL_AVAILABLE else None
-                disk_percent = disk.percent if disk else 0
-                
-                # Update resource monitor with snapshot
-                if hasattr(self, 'resource_monitor'):
-                    self.resource_monitor.update(cpu_percent, mem_percent, disk_percent)
-                
-                # Update graphs
-                if hasattr(self, 'graph_widget') and self.graph_widget:
-                    self.graph_widget.update_data(cpu_percent, mem_percent, disk_percent)
-                
-                # Update tray tooltip
-                if hasattr(self, 'tray_helper') and self.tray_helper:
-                    health = self.resource_monitor.get_health_score()
-                    self.tray_helper.update_tooltip(
-                        f"AIO-SDMS | CPU: {cpu_percent:.1f}% | RAM: {mem_percent:.1f}% | Health: {health}"
-                    )
-                
-                # Check notification thresholds (if enabled)
-                if self.config_manager.get('notifications.enabled', True):
-                    # CPU alerts
-                    if self.config_manager.get('notifications.cpu_alerts', True) and cpu_percent > 90:
-                        self.notification_manager.cpu_alert(cpu_percent)
-                    
-                    # Memory alerts
-                    if mem and mem_percent > 90:
-                        self.notification_manager.memory_alert(mem_percent, mem.available)
-                    
-                    # Disk alerts
-                    if disk and disk_percent > 90:
-                        self.notification_manager.disk_alert('/', disk_percent, disk.free)
-                
-                # Update UI
-                self._update_system_info()
-                self._update_battery_info()
-                
-            except Exception as e:
-                self.logger.error(f"Update error: {e}")
-            
-            time.sleep(2)
+    def _tick(self):
+        """Periodic refresh, scheduled on the Tk event loop"""
+        self._request_sample()
+        # While minimised, keep sampling for alerts and the tray tooltip, but less often
+        delay = _ICONIC_TICK_MS if self.root.state() == 'iconic' else _TICK_MS
+        self._after_id = self.root.after(delay, self._tick)
     
-    def _update_system_info(self):
-        """Update system information"""
-        if not PSUTIL_AVAILABLE:
+    def _request_sample(self):
+        """Start collecting metrics on the worker unless the previous sample is still pending"""
+        if self._poll_id is not None:
             return
-        
+        self._sample_future = self._event_thread.submit(self._collect_sample)
+        self._poll_id = self.root.after(_SAMPLE_POLL_MS, self._poll_sample)
+    
+    def _poll_sample(self):
+        """Apply the collected sample once the worker has finished it"""
+        if not self._sample_future.done():
+            self._poll_id = self.root.after(_SAMPLE_POLL_MS, self._poll_sample)
+            return
+        self._poll_id = None
+        sample = self._sample_future.result()
+        if sample:
+            self._apply_sample(sample)
+    
+    def _read_metrics(self):
+        """CPU percent, virtual memory and disk usage from psutil"""
+        return (psutil.cpu_percent(interval=None), psutil.virtual_memory(),
+                psutil.disk_usage(self._disk_path))
+    
+    def _collect_sample(self) -> Optional[Dict[str, Any]]:
+        """Read metrics, feed the resource monitor and alerts (runs on the sampler thread)"""
         try:
-            import platform
-            
-            # Dashboard updates
-            if 'os_label' in self.system_widgets:
-                os_info = f"OS: {platform.system()} {platform.release()}"
-                self.system_widgets['os_label'].config(text=os_info)
-            
-            if 'cpu_label' in self.system_widgets:
-                cpu_info = f"CPU: {platform.processor()}"
-                self.system_widgets['cpu_label'].config(text=cpu_info)
-            
-            if 'ram_label' in self.system_widgets:
-                total_ram = psutil.virtual_memory().total / (1024**3)
-                ram_info = f"RAM: {total_ram:.1f} GB"
-                self.system_widgets['ram_label'].config(text=ram_info)
+            # Get current metrics
+            cpu_percent, mem, disk = self._read_metrics()
+            mem_percent = mem.percent if mem else 0
+            disk_percent = disk.percent if disk else 0
             
-            # Quick stats
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            mem_percent = psutil.virtual_memory().percent
-            disk_percent = psutil.disk_usage('/').percent if platform.system() != 'Windows' else psutil.disk_usage('C:').percent
-            
-            if 'cpu_usage' in self.system_widgets:
-                self.system_widgets['cpu_usage'].config(text=f"CPU Usage: {cpu_percent:.1f}%")
-            
-            if 'mem_usage' in self.system_widgets:
-                self.system_widgets['mem_usage'].config(text=f"Memory Usage: {mem_percent:.1f}%")
+            # Update resource monitor with snapshot
+            if hasattr(self, 'resource_monitor'):
+                self.resource_monitor.update(cpu_percent, mem_percent, disk_percent)
             
-            if 'disk_usage' in self.system_widgets:
-                self.system_widgets['disk_usage'].config(text=f"Disk Usage: {disk_percent:.1f}%")
-            
-            # Monitoring tab
-            if 'cpu_percent' in self.system_widgets:
-                self.system_widgets['cpu_percent'].config(text=f"Usage: {cpu_percent:.1f}%")
+            # Update tray tooltip
+            if hasattr(self, 'tray_helper') and self.tray_helper:
+                health = self.resource_monitor.get_health_score()
+                self.tray_helper.update_tooltip(
+                    f"AIO-SDMS | CPU: {cpu_percent:.1f}% | RAM: {mem_percent:.1f}% | Health: {health}"
+                )
             
-            if 'cpu_cores' in self.system_widgets:
-                self.system_widgets['cpu_cores'].config(text=f"Cores: {psutil.cpu_count()}")
+            # Check notification thresholds (if enabled)
+            if self.config_manager.get('notifications.enabled', True):
+                # CPU alerts
+                if self.config_manager.get('notifications.cpu_alerts', True) and cpu_percent > 90:
+                    self.notification_manager.cpu_alert(cpu_percent)
+                
+                # Memory alerts
+                if mem and mem_percent > 90:
+                    self.notification_manager.memory_alert(mem_percent, mem.available)
+                
+                # Disk alerts
+                if disk and disk_percent > 90:
+                    self.notification_manager.disk_alert(self._disk_path, disk_percent, disk.free)
             
-            if 'mem_percent' in self.system_widgets:
-                mem = psutil.virtual_memory()
-                self.system_widgets['mem_percent'].config(text=f"Usage: {mem.percent:.1f}%")
-                self.system_widgets['mem_total'].config(text=f"Total: {mem.total / (1024**3):.1f} GB")
+            return {
+                'metrics': (cpu_percent, mem_percent, disk_percent),
+                'system': self._update_system_info(cpu_percent, mem_percent, disk_percent)
+            }
             
-            if 'disk_percent' in self.system_widgets:
-                disk = psutil.disk_usage('/') if platform.system() != 'Windows' else psutil.disk_usage('C:')
-                self.system_widgets['disk_percent'].config(text=f"Usage: {disk.percent:.1f}%")
-                self.system_widgets['disk_total'].config(text=f"Total: {disk.total / (1024**3):.1f} GB")
-                
         except Exception as e:
-            self.logger.error(f"System info update error: {e}")
+            self.logger.error(f"Update error: {e}")
+            return None
     
-    def _update_battery_info(self):
-        """Update battery information"""
-        if not PSUTIL_AVAILABLE:
+    def _apply_sample(self, sample: Dict[str, Any]):
+        """Push a collected sample into the graphs and labels"""
+        if not self.graph_widget:
+            # Keep recording until the lazily built Graphs tab can take it
+            self._graph_history.append((time.time(), *sample['metrics']))
+        
+        if self.root.state() == 'iconic':
+            # Nothing is visible; have the next sample resend every label
+            self._last_percent.clear()
             return
         
+        with self._batch():
+            # Update graphs
+            if self.graph_widget:
+                self.graph_widget.update_data(*sample['metrics'])
+            
+            # Update UI, skipping the usage labels while another tab is showing
+            if self.notebook.index(self.notebook.select()) in _USAGE_LABEL_TABS:
+                self._apply_values(sample['system'])
+            else:
+                self._last_percent.clear()
+    
+    def _apply_values(self, values: Dict[str, Any]):
+        """Write changed label texts (and the battery percentage) to their variables"""
+        text_vars = self._vars
+        last_text = self._last_text
+        for key, value in values.items():
+            if key == 'progress':
+                if self._battery_pct_var is not None and value != self._battery_pct:
+                    self._battery_pct = value
+                    self._battery_pct_var.set(value)
+                continue
+            var = text_vars.get(key)
+            if var is None:
+                continue  # Tab not built yet
+            if last_text.get(key) != value:
+                last_text[key] = value
+                var.set(value)
+    
+    def _battery_tick(self):
+        """Poll the battery on its own cadence"""
+        if self.root.state() == 'iconic':
+            self._battery_after_id = self.root.after(_ICONIC_TICK_MS, self._battery_tick)
+            return
+        self._battery_after_id = None
+        self._when_done(self._event_thread.submit(self._update_battery_info), self._on_battery_info)
+    
+    def _on_battery_info(self, future):
+        """Show a battery reading and schedule the next poll"""
+        values = future.result()
+        with self._batch():
+            self._apply_values(values)
+        
+        if values and 'progress' not in values:
+            return  # No battery present, stop polling
+        
+        state = (values.get('percent'), values.get('status'))
+        if state == self._battery_state:
+            self._battery_unchanged += 1
+        else:
+            self._battery_state = state
+            self._battery_unchanged = 0
+        delay = _BATTERY_IDLE_MS if self._battery_unchanged >= _BATTERY_IDLE_AFTER else _TICK_MS
+        self._battery_after_id = self.root.after(delay, self._battery_tick)
+    
+    @contextlib.contextmanager
+    def _batch(self):
+        """Group widget changes so Tk lays out and repaints once at the end"""
+        try:
+            yield
+        finally:
+            self.root.update_idletasks()
+    
+    def _label_var(self, key: str, text: str) -> tk.StringVar:
+        """Create the StringVar a frequently updated label displays"""
+        var = self._vars[key] = tk.StringVar(master=self.root, value=text)
+        return var
+    
+    def _set_text(self, widget, key: str, text: str):
+        """Configure a label's text only when it differs from what is already shown"""
+        if self._last_text.get(key) == text:
+            return
+        self._last_text[key] = text
+        widget.config(text=text)
+    
+    def _update_system_info(self, cpu_percent: float, mem_percent: float,
+                            disk_percent: float) -> Dict[str, str]:
+        """Format system information label texts from this tick's readings"""
+        values = {}
+        sw = self.system_widgets
+        last_percent = self._last_percent
+        for key, percent in (
+            # Quick stats
+            ('cpu_usage', cpu_percent),
+            ('mem_usage', mem_percent),
+            ('disk_usage', disk_percent),
+            # Monitoring tab
+            ('cpu_percent', cpu_percent),
+            ('mem_percent', mem_percent),
+            ('disk_percent', disk_percent)
+        ):
+            if key not in sw:
+                continue
+            # Only reformat when the value changes at the one decimal shown
+            shown = round(percent, 1)
+            if last_percent.get(key) != shown:
+                last_percent[key] = shown
+                values[key] = _PERCENT_LABELS[key].format(percent)
+        return values
+    
+    def _update_battery_info(self) -> Dict[str, Any]:
+        """Collect battery label texts and progress value"""
+        values = {}
         try:
             battery = psutil.sensors_battery()
             if battery:
                 percent = int(battery.percent)
                 plugged = battery.power_plugged
                 
-                self.battery_widgets['percent'].config(text=f"Battery: {percent}%")
-                self.battery_widgets['progress']['value'] = percent
+                values['percent'] = f"Battery: {percent}%"
+                values['progress'] = percent
                 
                 status = "Charging" if plugged else "Discharging"
-                self.battery_widgets['status'].config(text=f"Status: {status}")
+                values['status'] = f"Status: {status}"
                 
                 if battery.secsleft != psutil.POWER_TIME_UNLIMITED and battery.secsleft != psutil.POWER_TIME_UNKNOWN:
                     hours = battery.secsleft // 3600
                     minutes = (battery.secsleft % 3600) // 60
-                    self.battery_widgets['time'].config(text=f"Time Remaining: {hours}h {minutes}m")
+                    values['time'] = f"Time Remaining: {hours}h {minutes}m"
                 else:
-                    self.battery_widgets['time'].config(text="Time Remaining: Calculating...")
+                    values['time'] = "Time Remaining: Calculating..."
             else:
-                self.battery_widgets['percent'].config(text="No Battery Detected")
-                self.battery_widgets['status'].config(text="Status: N/A")
-                self.battery_widgets['time'].config(text="")
+                values['percent'] = "No Battery Detected"
+                values['status'] = "Status: N/A"
+                values['time'] = ""
                 
         except Exception as e:
             self.logger.error(f"Battery info update error: {e}")
+        return values
     
     def _refresh_all(self):
         """Refresh all data"""
-        self._update_system_info()
-        self._update_battery_info()
+        self._request_sample()
+        # Poll the battery now unless a poll is already in flight (or there is no battery)
+        if self._battery_after_id is not None:
+            self.root.after_cancel(self._battery_after_id)
+            self._battery_tick()
         messagebox.showinfo("Refresh", "All data refreshed successfully!")
     
     def _run_all_diagnostics(self):
         """Run all diagnostic tests"""
-        self.diagnostics_widgets['results'].delete(1.0, tk.END)
-        self.diagnostics_widgets['results'].insert(tk.END, "Running diagnostics tests...\n\n")
-        
-        def run_tests():
+        # Also reachable from the Tools menu before the tab has been opened
+        self._build_tab(self.notebook.tabs()[4])
+        results_text = self.diagnostics_widgets['results']
+        with self._batch(), self._writable(results_text):
+            results_text.delete(1.0, tk.END)
+            results_text.insert(tk.END, "Running diagnostics tests...\n\n")
+        
+        def run_tests() -> str:
             try:
                 if hasattr(self.diagnostics, 'run_all_tests'):
                     results = self.diagnostics.run_all_tests()
-                    output = "Diagnostic Tests Completed:\n\n"
-                    for result in results:
-                        output += f"{result}\n"
+                    output = "Diagnostic Tests Completed:\n\n" + "\n".join(map(str, results)) + "\n"
                 else:
                     output = "Diagnostics module not fully implemented.\n"
                     output += "Use CLI for full diagnostics: python main.py --cli diagnostics\n"
-                
-                self.diagnostics_widgets['results'].insert(tk.END, output)
+                return output
             except Exception as e:
-                self.diagnostics_widgets['results'].insert(tk.END, f"Error: {e}\n")
+                return f"Error: {e}\n"
+        
+        self._when_done(self._event_thread.submit(run_tests), lambda future: self._append_diag(future.result()))
+    
+    def _append_diag(self, text: str):
+        """Append text to the diagnostics results"""
+        results_text = self.diagnostics_widgets['results']
+        with self._batch(), self._writable(results_text):
+            results_text.insert(tk.END, text)
+            self._trim_text(results_text)
+    
+    def _trim_text(self, text_widget, max_lines: int = 1000):
+        """Drop the oldest lines so a Text widget never holds more than `max_lines`"""
+        line_count = int(text_widget.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            text_widget.delete('1.0', f'{line_count - max_lines + 1}.0')
+    
+    @contextlib.contextmanager
+    def _writable(self, text_widget):
+        """Temporarily enable a read-only Text widget for programmatic edits"""
+        text_widget.configure(state='normal')
+        try:
+            yield
+        finally:
+            text_widget.configure(state='disabled')
+    
+    def _when_done(self, future, callback):
+        """Call `callback(future)` on the Tk thread once a worker future has finished"""
+        if future.done():
+            callback(future)
+            return
+        
+        def poll():
+            self._done_poll_ids.discard(after_id)
+            self._when_done(future, callback)
         
-        threading.Thread(target=run_tests, daemon=True).start()
+        after_id = self.root.after(_SAMPLE_POLL_MS, poll)
+        self._done_poll_ids.add(after_id)
     
     def _clear_diagnostics(self):
         """Clear diagnostics results"""
-        self.diagnostics_widgets['results'].delete(1.0, tk.END)
+        results_text = self.diagnostics_widgets['results']
+        with self._writable(results_text):
+            results_text.delete(1.0, tk.END)
     
     def _show_about(self):
         """Show about dialog"""
@@ -660,10 +901,15 @@ class GUIInterface:
         if hasattr(self, 'config_manager'):
             self.config_manager.save_window_geometry(self.root)
         
-        # Stop update thread
-        self._running = False
-        if self._update_thread:
-            self._update_thread.join(timeout=1)
+        # Stop periodic updates and cancel any background work still in flight
+        for after_id in (self._after_id, self._poll_id, self._battery_after_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        # Results finishing during shutdown must not reach the destroyed widgets
+        for after_id in self._done_poll_ids:
+            self.root.after_cancel(after_id)
+        self._done_poll_ids.clear()
+        self._event_thread.stop()
         
         # Cleanup tray
         if hasattr(self, 'tray_helper') and self.tray_helper:
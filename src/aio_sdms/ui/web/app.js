@@ -161,18 +161,12 @@ function loadSectionContent(sectionId) {
  */
 async function loadSystemStatus() {
     try {
-        // Load basic system metrics
-        const response = await fetch('/api/monitoring/metrics');
+        // Load system metrics and battery status in one request
+        const response = await fetch('/api/dashboard?include=metrics,battery');
         if (response.ok) {
             const data = await response.json();
-            updateSystemStatus(data);
-        }
-        
-        // Load battery status
-        const batteryResponse = await fetch('/api/battery/info');
-        if (batteryResponse.ok) {
-            const batteryData = await batteryResponse.json();
-            updateBatteryStatus(batteryData);
+            updateSystemStatus(data.metrics);
+            updateBatteryStatus(data.battery);
         }
     } catch (error) {
         console.error('Error loading system status:', error);
@@ -461,7 +455,7 @@ function updateTopProcesses(processes) {
                         <tr>
                             <td>${proc.name || 'Unknown'}</td>
                             <td>${(proc.cpu_percent || 0).toFixed(1)}%</td>
-                            <td>${formatBytes(proc.memory_info || 0)}</td>
+                            <td>${formatBytes(proc.memory_info?.rss || 0)}</td>
                         </tr>
                     `).join('')}
                 </tbody>
@@ -4,21 +4,38 @@ Flask-based web interface with REST API and Single Page Application
 """
 
 import json
+import gzip
+import heapq
+import hashlib
 import threading
+import time
 import webbrowser
 import os
 import platform
-from typing import Optional, Dict, Any
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, Tuple
 from pathlib import Path
 
 try:
-    from flask import Flask, render_template, jsonify, request, send_from_directory, send_file
+    from flask import Flask, Response, render_template, jsonify, request, send_from_directory
+    from flask.json.provider import DefaultJSONProvider
     from flask_cors import CORS
     import psutil
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 from aio_sdms.utils.config import Config
 from aio_sdms.utils.logger import Logger
 from aio_sdms.core.battery.battery_monitor import create_battery_monitor
@@ -26,24 +43,106 @@ from aio_sdms.core.diagnostics.hardware_tests import create_diagnostics
 from aio_sdms.core.monitoring.system_monitor import create_system_monitor
 from aio_sdms.core.package_mgmt.winget_manager import create_package_manager
 
+# Seconds a metrics snapshot is reused across requests
+_METRICS_TTL = 1.0
+
+# Seconds before the winget availability probe is repeated
+_PACKAGE_PROBE_TTL = 300.0
+
+# SPA files served from memory, and how long browsers may cache them
+_SPA_ASSETS = (
+    ('index.html', 'text/html'),
+    ('main.css', 'text/css'),
+    ('app.js', 'application/javascript'),
+)
+_ASSET_MAX_AGE = 86400
+
+# WebInterface attributes holding the lazily created tools
+_TOOL_NAMES = ('battery_monitor', 'diagnostics', 'system_monitor', 'package_manager')
+
+if FLASK_AVAILABLE and orjson is not None:
+    class _ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson"""
+        
+        @staticmethod
+        def _orjson_default(obj: Any) -> Any:
+            # orjson only handles exact tuples; stdlib json also writes subclasses as arrays
+            if isinstance(obj, tuple):
+                return list(obj)
+            return DefaultJSONProvider.default(obj)
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self._orjson_default, option=option).decode()
+        
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+class _LazyTool:
+    """Instance attribute built by a factory on first access (cached_property for 3.7)"""
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._name = None
+        # Stops a request and the warm-up thread from building the tool twice
+        self._lock = threading.Lock()
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            if self._name not in instance.__dict__:
+                instance.__dict__[self._name] = self._factory()
+        # Later lookups find the instance attribute and skip the descriptor
+        return instance.__dict__[self._name]
+
 class WebInterface:
     """Flask-based Web Interface implementation"""
     
+    # Created on first use so __init__ and the port binding do not wait on them
+    battery_monitor = _LazyTool(create_battery_monitor)
+    diagnostics = _LazyTool(create_diagnostics)
+    system_monitor = _LazyTool(create_system_monitor)
+    package_manager = _LazyTool(create_package_manager)
+    
     def __init__(self, config: Config, logger: Logger):
         self.config = config
         self.logger = logger
         self.app = None
-        self._initialize_tools()
+        # Requests are served on separate threads; diagnostics share one results list
+        self._diagnostics_lock = threading.Lock()
+        # (monotonic time, payload) of the last metrics collection
+        self._metrics_snapshot = None
+        self._metrics_lock = threading.Lock()
+        # (monotonic time, available, version) of the last winget probe
+        self._package_status = None
+        # Sections of /api/dashboard, gathered on a shared pool
+        self._dashboard_sections = {
+            "battery": self._battery_payload,
+            "metrics": self._metrics_payload,
+            "packages_status": self._package_status_payload,
+            "packages_count": self._package_count_payload,
+        }
+        self._dashboard_pool = ThreadPoolExecutor(max_workers=len(self._dashboard_sections),
+                                                  thread_name_prefix="web-dashboard")
         
         if not FLASK_AVAILABLE:
             self.logger.error("Flask is not installed. Install with: pip install flask flask-cors")
+        else:
+            # Baseline for the non-blocking cpu_percent() fallback
+            psutil.cpu_percent(interval=None)
     
-    def _initialize_tools(self):
-        """Initialize all tool instances"""
-        self.battery_monitor = create_battery_monitor()
-        self.diagnostics = create_diagnostics()
-        self.system_monitor = create_system_monitor()
-        self.package_manager = create_package_manager()
+    def _warm_tools(self):
+        """Create the tools on background threads in the serving process"""
+        for name in _TOOL_NAMES:
+            threading.Thread(target=getattr, args=(self, name), name=f"web-init-{name}", daemon=True).start()
     
     def run(self, host: str = "localhost", port: int = 8080):
         """Run the web interface"""
@@ -58,6 +157,21 @@ class WebInterface:
                         template_folder=str(Path(__file__).parent / "templates"),
                         static_folder=str(Path(__file__).parent / "static"))
         
+        # jsonify() and the streamed package list serialise through orjson when it is installed
+        if orjson is not None:
+            self.app.json = _ORJSONProvider(self.app)
+        
+        # Compress JSON and script responses; the preloaded SPA files are already gzipped
+        if Compress is not None:
+            self.app.config.update(
+                COMPRESS_MIMETYPES=['application/json', 'text/css', 'application/javascript'],
+                COMPRESS_LEVEL=5,
+                # Compressing a streamed response buffers all of it first, which
+                # would hold back the package list until winget finishes
+                COMPRESS_STREAMS=False
+            )
+            Compress(self.app)
+        
         # Enable CORS for API endpoints
         CORS(self.app)
         
@@ -72,23 +186,325 @@ class WebInterface:
             threading.Timer(1.0, lambda: webbrowser.open(f"http://{host}:{port}")).start()
         
         try:
-            self.app.run(host=host, port=port, debug=self.config.get('interface.web.debug', False))
+            if self.config.get('interface.web.production', False) and self._serve_production(host, port):
+                return
+            self._warm_tools()
+            # One thread per request, so a slow winget or psutil probe does not
+            # hold up the other endpoints
+            self.app.run(host=host, port=port, debug=self.config.get('interface.web.debug', False),
+                         threaded=True)
         except KeyboardInterrupt:
             self.logger.info("Web interface stopped by user")
         except Exception as e:
             self.logger.error(f"Web interface error: {e}")
             print(f"Error starting web server: {e}")
     
+    def _serve_production(self, host: str, port: int) -> bool:
+        """Serve the app with gunicorn, or waitress where gunicorn is unavailable"""
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            # Not installed, or on Windows where gunicorn does not run
+            return self._serve_waitress(host, port)
+        
+        app = self.app
+        options = {
+            'bind': f"{host}:{port}",
+            'workers': self.config.get('interface.web.workers', 2 * (os.cpu_count() or 1) + 1),
+            # The handlers block in psutil and subprocess calls, which threads
+            # overlap without monkey-patching
+            'worker_class': 'gthread',
+            'threads': 4,
+            # Warm-up threads do not survive fork, and a tool built in the master
+            # would be shared by every worker, so each worker warms its own
+            'post_fork': lambda server, worker: self._warm_tools(),
+        }
+        
+        class _GunicornApp(BaseApplication):
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+            
+            def load(self):
+                return app
+        
+        self.logger.info(f"Serving with gunicorn ({options['workers']} workers)")
+        _GunicornApp().run()
+        return True
+    
+    def _serve_waitress(self, host: str, port: int) -> bool:
+        """Serve the app with waitress; False if it is not installed"""
+        try:
+            from waitress import serve
+        except ImportError:
+            self.logger.warning("Neither gunicorn nor waitress is available, falling back to the development server")
+            return False
+        
+        self.logger.info("Serving with waitress")
+        self._warm_tools()
+        serve(self.app, host=host, port=port, threads=8, connection_limit=1000)
+        return True
+    
+    def _get_metrics(self) -> Dict[str, Any]:
+        """Monitoring metrics, shared by all requests within _METRICS_TTL"""
+        snapshot = self._metrics_snapshot
+        if snapshot is None or time.monotonic() - snapshot[0] > _METRICS_TTL:
+            with self._metrics_lock:
+                # Another request may have refreshed it while we waited
+                snapshot = self._metrics_snapshot
+                if snapshot is None or time.monotonic() - snapshot[0] > _METRICS_TTL:
+                    snapshot = (time.monotonic(), self._collect_metrics())
+                    self._metrics_snapshot = snapshot
+        return snapshot[1]
+    
+    def _collect_metrics(self) -> Dict[str, Any]:
+        """Gather system metrics, top processes and network I/O"""
+        # Get basic system metrics
+        if hasattr(self.system_monitor, 'get_current_metrics'):
+            metrics = self.system_monitor.get_current_metrics()
+            if hasattr(metrics, '_asdict'):
+                metrics_dict = metrics._asdict()
+            else:
+                metrics_dict = metrics if isinstance(metrics, dict) else {}
+        else:
+            # Fallback using psutil directly
+            metrics_dict = {
+                # Usage since the previous call; requests are at least _METRICS_TTL apart
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_percent": psutil.virtual_memory().percent,
+                "disk_percent": psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent
+            }
+        
+        # Add system information
+        memory = psutil.virtual_memory()
+        cpu_freq = psutil.cpu_freq()
+        metrics_dict.update({
+            "platform": platform.system(),
+            "architecture": platform.architecture()[0],
+            "processor": platform.processor(),
+            "network_connected": True,  # Basic assumption
+            "memory_info": {
+                "total": memory.total,
+                "available": memory.available,
+                "used": memory.used
+            },
+            "cpu_info": {
+                "cores": psutil.cpu_count(),
+                "frequency": cpu_freq.current if cpu_freq else 0,
+                "brand": platform.processor()
+            },
+            "top_processes": []
+        })
+        
+        # Get top processes (keeps only the current top 10 while scanning)
+        try:
+            metrics_dict["top_processes"] = heapq.nlargest(
+                10, self._iter_processes(memory.total), key=lambda p: p['cpu_percent']
+            )
+        except Exception:
+            pass
+        
+        # Add network I/O
+        try:
+            net_io = psutil.net_io_counters()
+            metrics_dict["network_io"] = {
+                "bytes_sent": net_io.bytes_sent,
+                "bytes_recv": net_io.bytes_recv
+            }
+        except Exception:
+            metrics_dict["network_io"] = {"bytes_sent": 0, "bytes_recv": 0}
+        
+        return metrics_dict
+    
+    def _iter_processes(self, memory_total: int) -> Iterator[Dict[str, Any]]:
+        """Yield a summary dict per running process"""
+        for proc in psutil.process_iter():
+            try:
+                # Serve every attribute from one read of the process's stat files
+                with proc.oneshot():
+                    proc_memory = proc.memory_info()
+                    proc_info = {
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'cpu_percent': proc.cpu_percent(),
+                        # Same formula as proc.memory_percent(), without re-reading memory_info
+                        'memory_percent': proc_memory.rss * 100.0 / memory_total if memory_total else 0.0,
+                        'memory_info': proc_memory._asdict()
+                    }
+                yield proc_info
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    
+    def _stream_packages(self) -> Iterator[str]:
+        """Yield the installed-packages JSON document one package at a time"""
+        dumps = self.app.json.dumps
+        separator = ''
+        yield '{"packages":['
+        try:
+            with contextlib.closing(self.package_manager.iter_installed_packages()) as packages:
+                for package in packages:
+                    yield separator + dumps(package._asdict() if hasattr(package, '_asdict') else package)
+                    separator = ','
+        except Exception as e:
+            # The status line is already sent, so report the failure in the body
+            self.logger.error(f"Package list error: {e}")
+            yield '],"error":' + dumps(str(e)) + '}'
+            return
+        yield ']}'
+    
+    def _get_package_status(self) -> Tuple[bool, str]:
+        """winget availability and version, re-probed every _PACKAGE_PROBE_TTL seconds"""
+        status = self._package_status
+        if status is not None and time.monotonic() - status[0] <= _PACKAGE_PROBE_TTL:
+            return status[1:]
+        
+        if hasattr(self.package_manager, 'is_available'):
+            # The manager caches its own probe; only force a new one once ours expires
+            if status is not None and hasattr(self.package_manager, 'refresh_availability'):
+                available = self.package_manager.refresh_availability()
+            else:
+                available = self.package_manager.is_available()
+            version = getattr(self.package_manager, 'get_version', lambda: None)() or "Unknown"
+        else:
+            # Basic winget check
+            import subprocess
+            try:
+                result = subprocess.run(['winget', '--version'], capture_output=True, text=True, timeout=5)
+                available = result.returncode == 0
+                version = result.stdout.strip() if available else "Unknown"
+            except Exception:
+                available = False
+                version = "Unknown"
+        
+        self._package_status = (time.monotonic(), available, version)
+        return available, version
+    
+    @staticmethod
+    def _load_assets() -> Dict[str, Tuple[str, bytes, bytes, str]]:
+        """Read the SPA files into (mimetype, data, gzipped data, etag) entries"""
+        assets = {}
+        base = Path(__file__).parent
+        for name, mimetype in _SPA_ASSETS:
+            try:
+                data = (base / name).read_bytes()
+            except OSError:
+                continue
+            assets[name] = (mimetype, data, gzip.compress(data), hashlib.sha1(data).hexdigest())
+        return assets
+    
+    def _asset_response(self, name: str) -> "Response":
+        """Serve a preloaded SPA file, gzipped if accepted and 304 if unchanged"""
+        mimetype, data, compressed, etag = self._assets[name]
+        use_gzip = request.accept_encodings['gzip'] > 0
+        response = Response(compressed if use_gzip else data, mimetype=mimetype)
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+            # Each encoding is a separate representation with its own tag
+            etag += '-gz'
+        response.vary.add('Accept-Encoding')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = _ASSET_MAX_AGE
+        return response.make_conditional(request)
+    
+    def _battery_payload(self) -> Tuple[Dict[str, Any], int]:
+        """Battery information and HTTP status"""
+        try:
+            if hasattr(self.battery_monitor, 'is_battery_available') and not self.battery_monitor.is_battery_available():
+                return {
+                    "battery_percent": 0,
+                    "power_plugged": False,
+                    "error": "No battery available"
+                }, 200
+            
+            # Get basic battery info
+            if hasattr(self.battery_monitor, 'get_detailed_info'):
+                info = self.battery_monitor.get_detailed_info()
+            elif hasattr(self.battery_monitor, 'get_battery_info'):
+                info = self.battery_monitor.get_battery_info()
+            else:
+                # Fallback using psutil
+                battery = psutil.sensors_battery()
+                if battery:
+                    info = {
+                        "battery_percent": int(battery.percent),
+                        "power_plugged": battery.power_plugged
+                    }
+                else:
+                    info = {"battery_percent": 0, "power_plugged": False}
+            
+            return info, 200
+        except Exception as e:
+            self.logger.error(f"Battery info error: {e}")
+            return {
+                "battery_percent": 0,
+                "power_plugged": False,
+                "error": str(e)
+            }, 500
+    
+    def _metrics_payload(self) -> Tuple[Dict[str, Any], int]:
+        """Monitoring metrics and HTTP status"""
+        try:
+            return self._get_metrics(), 200
+        except Exception as e:
+            self.logger.error(f"Monitoring metrics error: {e}")
+            return {
+                "error": str(e),
+                "cpu_percent": 0,
+                "memory_percent": 0,
+                "disk_percent": 0,
+                "network_connected": False
+            }, 500
+    
+    def _package_status_payload(self) -> Tuple[Dict[str, Any], int]:
+        """winget availability and HTTP status"""
+        try:
+            available, version = self._get_package_status()
+            
+            return {
+                "available": available,
+                "version": version
+            }, 200
+        except Exception as e:
+            return {"available": False, "error": str(e)}, 200
+    
+    def _package_count_payload(self) -> Tuple[Dict[str, Any], int]:
+        """Installed and upgradable package counts and HTTP status"""
+        try:
+            installed_count = 0
+            upgradable_count = 0
+            
+            if hasattr(self.package_manager, 'get_installed_packages'):
+                installed = self.package_manager.get_installed_packages()
+                installed_count = len(installed) if installed else 0
+            
+            if hasattr(self.package_manager, 'get_upgradable_packages'):
+                upgradable = self.package_manager.get_upgradable_packages()
+                upgradable_count = len(upgradable) if upgradable else 0
+            
+            return {
+                "installed_count": installed_count,
+                "upgradable_count": upgradable_count
+            }, 200
+        except Exception as e:
+            return {
+                "installed_count": 0,
+                "upgradable_count": 0,
+                "error": str(e)
+            }, 200
+    
     def _setup_routes(self):
         """Setup Flask routes"""
         
+        # The SPA files are read and compressed once, not on every hit
+        self._assets = self._load_assets()
+        
         # Main SPA route - serve index.html
         @self.app.route('/')
         def index():
             """Main single-page application"""
-            index_path = Path(__file__).parent / "index.html"
-            if index_path.exists():
-                return send_file(str(index_path))
+            if 'index.html' in self._assets:
+                return self._asset_response('index.html')
             else:
                 # Fallback to dashboard template
                 return render_template('dashboard.html')
@@ -97,18 +513,16 @@ class WebInterface:
         @self.app.route('/main.css')
         def main_css():
             """Serve main CSS file"""
-            css_path = Path(__file__).parent / "main.css"
-            if css_path.exists():
-                return send_file(str(css_path), mimetype='text/css')
+            if 'main.css' in self._assets:
+                return self._asset_response('main.css')
             else:
                 return "/* Main CSS not found */", 404
         
         @self.app.route('/app.js')
         def app_js():
             """Serve main JavaScript file"""
-            js_path = Path(__file__).parent / "app.js"
-            if js_path.exists():
-                return send_file(str(js_path), mimetype='application/javascript')
+            if 'app.js' in self._assets:
+                return self._asset_response('app.js')
             else:
                 return "// Main JS not found", 404
         
@@ -138,115 +552,14 @@ class WebInterface:
         @self.app.route('/api/battery/info')
         def api_battery_info():
             """Get battery information"""
-            try:
-                if hasattr(self.battery_monitor, 'is_battery_available') and not self.battery_monitor.is_battery_available():
-                    return jsonify({
-                        "battery_percent": 0,
-                        "power_plugged": False,
-                        "error": "No battery available"
-                    })
-                
-                # Get basic battery info
-                if hasattr(self.battery_monitor, 'get_detailed_info'):
-                    info = self.battery_monitor.get_detailed_info()
-                elif hasattr(self.battery_monitor, 'get_battery_info'):
-                    info = self.battery_monitor.get_battery_info()
-                else:
-                    # Fallback using psutil
-                    battery = psutil.sensors_battery()
-                    if battery:
-                        info = {
-                            "battery_percent": int(battery.percent),
-                            "power_plugged": battery.power_plugged
-                        }
-                    else:
-                        info = {"battery_percent": 0, "power_plugged": False}
-                
-                return jsonify(info)
-            except Exception as e:
-                self.logger.error(f"Battery info error: {e}")
-                return jsonify({
-                    "battery_percent": 0,
-                    "power_plugged": False,
-                    "error": str(e)
-                }), 500
+            payload, status = self._battery_payload()
+            return jsonify(payload), status
         
         @self.app.route('/api/monitoring/metrics')
         def api_monitoring_metrics():
             """Get comprehensive system monitoring metrics"""
-            try:
-                # Get basic system metrics
-                if hasattr(self.system_monitor, 'get_current_metrics'):
-                    metrics = self.system_monitor.get_current_metrics()
-                    if hasattr(metrics, '_asdict'):
-                        metrics_dict = metrics._asdict()
-                    else:
-                        metrics_dict = metrics if isinstance(metrics, dict) else {}
-                else:
-                    # Fallback using psutil directly
-                    metrics_dict = {
-                        "cpu_percent": psutil.cpu_percent(interval=1),
-                        "memory_percent": psutil.virtual_memory().percent,
-                        "disk_percent": psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent
-                    }
-                
-                # Add system information
-                metrics_dict.update({
-                    "platform": platform.system(),
-                    "architecture": platform.architecture()[0],
-                    "processor": platform.processor(),
-                    "network_connected": True,  # Basic assumption
-                    "memory_info": {
-                        "total": psutil.virtual_memory().total,
-                        "available": psutil.virtual_memory().available,
-                        "used": psutil.virtual_memory().used
-                    },
-                    "cpu_info": {
-                        "cores": psutil.cpu_count(),
-                        "frequency": psutil.cpu_freq().current if psutil.cpu_freq() else 0,
-                        "brand": platform.processor()
-                    },
-                    "top_processes": []
-                })
-                
-                # Get top processes
-                try:
-                    processes = []
-                    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info']):
-                        try:
-                            proc_info = proc.info
-                            proc_info['cpu_percent'] = proc.cpu_percent()
-                            proc_info['memory_percent'] = proc.memory_percent()
-                            processes.append(proc_info)
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                    
-                    # Sort by CPU usage and get top 10
-                    processes.sort(key=lambda x: x.get('cpu_percent', 0), reverse=True)
-                    metrics_dict["top_processes"] = processes[:10]
-                except Exception:
-                    pass
-                
-                # Add network I/O
-                try:
-                    net_io = psutil.net_io_counters()
-                    metrics_dict["network_io"] = {
-                        "bytes_sent": net_io.bytes_sent,
-                        "bytes_recv": net_io.bytes_recv
-                    }
-                except Exception:
-                    metrics_dict["network_io"] = {"bytes_sent": 0, "bytes_recv": 0}
-                
-                return jsonify(metrics_dict)
-            except Exception as e:
-                self.logger.error(f"Monitoring metrics error: {e}")
-                return jsonify({
-                    "error": str(e),
-                    "cpu_percent": 0,
-                    "memory_percent": 0,
-                    "disk_percent": 0,
-                    "network_connected": False
-                }), 500
+            payload, status = self._metrics_payload()
+            return jsonify(payload), status
         
         @self.app.route('/api/diagnostics/run', methods=['POST'])
         def api_run_diagnostics():
@@ -256,12 +569,13 @@ class WebInterface:
                 test_name = data.get('test', 'all')
                 
                 if hasattr(self.diagnostics, 'run_single_test'):
-                    if test_name == 'all':
-                        results = self.diagnostics.run_all_tests() if hasattr(self.diagnostics, 'run_all_tests') else []
-                        summary = self.diagnostics.get_test_summary() if hasattr(self.diagnostics, 'get_test_summary') else {"results": results}
-                    else:
-                        result = self.diagnostics.run_single_test(test_name)
-                        summary = {"status": "passed" if result else "failed", "test": test_name}
+                    with self._diagnostics_lock:
+                        if test_name == 'all':
+                            results = self.diagnostics.run_all_tests() if hasattr(self.diagnostics, 'run_all_tests') else []
+                            summary = self.diagnostics.get_test_summary() if hasattr(self.diagnostics, 'get_test_summary') else {"results": results}
+                        else:
+                            result = self.diagnostics.run_single_test(test_name)
+                            summary = {"status": "passed" if result else "failed", "test": test_name}
                 else:
                     # Basic test simulation
                     summary = {"status": "passed", "test": test_name, "message": f"{test_name} test completed"}
@@ -274,31 +588,16 @@ class WebInterface:
         @self.app.route('/api/packages/status')
         def api_packages_status():
             """Check package manager availability"""
-            try:
-                if hasattr(self.package_manager, 'is_available'):
-                    available = self.package_manager.is_available()
-                    version = getattr(self.package_manager, 'get_version', lambda: "Unknown")()
-                else:
-                    # Basic winget check
-                    import subprocess
-                    try:
-                        result = subprocess.run(['winget', '--version'], capture_output=True, text=True, timeout=5)
-                        available = result.returncode == 0
-                        version = result.stdout.strip() if available else "Unknown"
-                    except Exception:
-                        available = False
-                        version = "Unknown"
-                
-                return jsonify({
-                    "available": available,
-                    "version": version
-                })
-            except Exception as e:
-                return jsonify({"available": False, "error": str(e)})
+            payload, status = self._package_status_payload()
+            return jsonify(payload), status
         
         @self.app.route('/api/packages/list')
         def api_packages_list():
             """List installed packages"""
+            if hasattr(self.package_manager, 'iter_installed_packages'):
+                # Sent as winget reports them, without building the whole list first
+                return Response(self._stream_packages(), mimetype='application/json')
+            
             try:
                 if hasattr(self.package_manager, 'get_installed_packages'):
                     packages = self.package_manager.get_installed_packages()
@@ -316,28 +615,21 @@ class WebInterface:
         @self.app.route('/api/packages/count')
         def api_packages_count():
             """Get package count information"""
-            try:
-                installed_count = 0
-                upgradable_count = 0
-                
-                if hasattr(self.package_manager, 'get_installed_packages'):
-                    installed = self.package_manager.get_installed_packages()
-                    installed_count = len(installed) if installed else 0
-                
-                if hasattr(self.package_manager, 'get_upgradable_packages'):
-                    upgradable = self.package_manager.get_upgradable_packages()
-                    upgradable_count = len(upgradable) if upgradable else 0
-                
-                return jsonify({
-                    "installed_count": installed_count,
-                    "upgradable_count": upgradable_count
-                })
-            except Exception as e:
-                return jsonify({
-                    "installed_count": 0,
-                    "upgradable_count": 0,
-                    "error": str(e)
-                })
+            payload, status = self._package_count_payload()
+            return jsonify(payload), status
+        
+        @self.app.route('/api/dashboard')
+        def api_dashboard():
+            """Battery, metrics and package status/counts in one response"""
+            # ?include=battery,metrics limits the response to those sections
+            include = request.args.get('include')
+            names = include.split(',') if include else list(self._dashboard_sections)
+            # Gathered concurrently, so the response waits only for the slowest section
+            futures = {
+                name: self._dashboard_pool.submit(self._dashboard_sections[name])
+                for name in names if name in self._dashboard_sections
+            }
+            return jsonify({name: future.result()[0] for name, future in futures.items()})
         
         # Static files handling
         @self.app.route('/static/<path:filename>')
@@ -37,7 +37,8 @@ class Config:
                 "web": {
                     "port": 8080,
                     "host": "localhost",
-                    "auto_open_browser": True
+                    "auto_open_browser": True,
+                    "production": False
                 }
             },
             "tools": {
@@ -117,7 +117,32 @@ class PerformanceGraph:
             self._update_matplotlib_graph()
         else:
             self._update_fallback_display(cpu, memory, disk)
-    
+
+    def load_history(self, samples):
+        """
+        Prefill the graph with samples taken before it was created
+
+        Args:
+            samples: Iterable of (time.time() stamp, cpu, memory, disk) tuples, oldest first
+        """
+        samples = list(samples)[-self.max_points:]
+        if not samples:
+            return
+
+        # Start the time axis at the first recorded sample rather than now
+        self.start_time = min(self.start_time, samples[0][0])
+        for stamp, cpu, memory, disk in samples:
+            self.timestamps.append(stamp - self.start_time)
+            self.cpu_data.append(cpu)
+            self.memory_data.append(memory)
+            self.disk_data.append(disk)
+
+        # Redraw once for the whole batch
+        if MATPLOTLIB_AVAILABLE:
+            self._update_matplotlib_graph()
+        else:
+            self._update_fallback_display(*samples[-1][1:])
+
     def _update_matplotlib_graph(self):
         """Update matplotlib graph"""
         # Update line data
@@ -10,6 +10,9 @@ import functools
 from typing import Dict, Any, Callable, Optional
 from pathlib import Path
 
+# dataclass(**DATACLASS_SLOTS) adds __slots__ where supported (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 def get_system_info() -> Dict[str, str]:
     """Get basic system information"""
     return {
@@ -21,17 +24,22 @@ def get_system_info() -> Dict[str, str]:
         'hostname': platform.node()
     }
 
+# Resolved once at import; the platform cannot change at runtime
+IS_WINDOWS = sys.platform == 'win32'
+IS_LINUX = sys.platform.startswith('linux')
+IS_MACOS = sys.platform == 'darwin'
+
 def is_windows() -> bool:
     """Check if running on Windows"""
-    return platform.system().lower() == 'windows'
+    return IS_WINDOWS
 
 def is_linux() -> bool:
     """Check if running on Linux"""
-    return platform.system().lower() == 'linux'
+    return IS_LINUX
 
 def is_macos() -> bool:
     """Check if running on macOS"""
-    return platform.system().lower() == 'darwin'
+    return IS_MACOS
 
 def format_bytes(bytes_value: int) -> str:
     """Format bytes into human readable format"""